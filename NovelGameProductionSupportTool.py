@@ -1,21 +1,31 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, simpledialog
+from tkinter import ttk, messagebox, filedialog
 import json
-import uuid
+import gzip
+import hashlib
+import io
+import os
+import re
 import configparser
-import importlib
+import importlib.machinery
 import importlib.util
-import inspect
 import sys
+import threading
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Type, Optional, Any, Tuple, Callable
 import math
-from dataclasses import dataclass, field
 from enum import Enum, auto
 
 # UIテーマライブラリ (pip install sv-ttk)
 import sv_ttk
 
+# 高速JSONライブラリ (任意: pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- 定数定義 ---
 class PluginState(Enum):
     LOADED = auto()
@@ -23,49 +33,208 @@ class PluginState(Enum):
     ERROR = auto()
 
 DEFAULT_NODE_RADIUS = 35
+NODE_HIT_RADIUS = DEFAULT_NODE_RADIUS * 1.2  # 接続ゾーンを含むノードの当たり判定の半径（ワールド座標）
+NODE_GRID_CELL_SIZE = NODE_HIT_RADIUS * 2  # 当たり判定用グリッドのセルの大きさ（周囲3x3セルで判定範囲を覆う）
 DRAG_THRESHOLD_SQUARED = 5 * 5  # 5ピクセル
+SCENE_SAVE_DEBOUNCE_MS = 150  # シーン編集内容の反映を遅延させる時間
+SAVE_POLL_INTERVAL_MS = 100  # バックグラウンド保存の完了確認間隔
+LOAD_POLL_INTERVAL_MS = 50  # バックグラウンド読み込み中に画面を更新する間隔
+COMPRESSED_PROJECT_SUFFIX = ".ngpz"  # gzip圧縮したコンパクトJSONで保存する拡張子
+GZIP_MAGIC = b"\x1f\x8b"
+PROJECT_GZIP_LEVEL = 6
+PROJECT_FILETYPES = [
+    ("ノベルプロジェクト", "*.ngp"),
+    ("圧縮ノベルプロジェクト", "*" + COMPRESSED_PROJECT_SUFFIX),
+]
 MIN_ZOOM = 0.2
 MAX_ZOOM = 3.0
 DEFAULT_ZOOM = 1.0
 
+# ショートカットキーの既定値
+DEFAULT_SHORTCUTS: Dict[str, str] = {
+    'new_project': 'Control-N',
+    'open_project': 'Control-O',
+    'save_project': 'Control-S',
+    'save_project_as': 'Control-Shift-S',
+    'add_scene': 'Control-A',
+    'add_branch': 'Control-B',
+    'zoom_in': 'Control-plus',
+    'zoom_out': 'Control-minus',
+    'reset_view': 'Control-0'
+}
+
+# ショートカット設定の対象アクションと表示名（設定ダイアログの表示順）
+SHORTCUT_ACTIONS: Tuple[Tuple[str, str], ...] = (
+    ('new_project', "新規プロジェクト"),
+    ('open_project', "プロジェクトを開く"),
+    ('save_project', "プロジェクトを保存"),
+    ('save_project_as', "名前を付けて保存"),
+    ('add_scene', "シーンを追加"),
+    ('add_branch', "分岐を追加"),
+    ('zoom_in', "ズームイン"),
+    ('zoom_out', "ズームアウト"),
+    ('reset_view', "ビューをリセット"),
+)
+# ショートカットを表示するメニュー項目: (メニュー, 項目のラベル, アクション)
+MENU_ACCELERATOR_ITEMS: Tuple[Tuple[str, str, str], ...] = (
+    ("file", "新規", 'new_project'),
+    ("file", "開く...", 'open_project'),
+    ("file", "保存", 'save_project'),
+    ("file", "名前を付けて保存...", 'save_project_as'),
+    ("edit", "シーンを追加", 'add_scene'),
+)
+
 # --- データ構造 ---
-@dataclass
+class Branch:
+    """
+    シーン間の分岐（選択肢）を保持するクラス。
+    text/target/condition以外のキー（プラグイン等が追加したもの）はextraに保持し、保存時にそのまま書き戻す。
+    """
+    __slots__ = ("text", "target", "condition", "extra")
+    _FIELDS = frozenset(("text", "target", "condition"))
+
+    def __init__(self, text: str, target: str, condition: str = "", extra: Optional[Dict[str, Any]] = None):
+        self.text: str = text
+        self.target: str = target
+        self.condition: str = condition
+        self.extra: Optional[Dict[str, Any]] = extra or None
+
+    def __repr__(self) -> str:
+        return f"Branch(text={self.text!r}, target={self.target!r}, condition={self.condition!r})"
+
+    def __getitem__(self, key: str) -> Any:
+        """以前の辞書形式の分岐（branch["target"] など）を読むコードとの互換用"""
+        if key in Branch._FIELDS:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "text": self.text,
+            "target": self.target,
+            "condition": self.condition
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Branch':
+        get = data.get
+        extra = None
+        if not Branch._FIELDS.issuperset(data):
+            extra = {k: v for k, v in data.items() if k not in Branch._FIELDS}
+        return cls(get("text", ""), get("target", ""), get("condition", ""), extra)
+
 class Scene:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    name: str = "New Scene"
-    content: str = ""
-    x: float = 0.0
-    y: float = 0.0
-    branches: List[Dict[str, str]] = field(default_factory=list)
+    """
+    シーンのデータを保持するクラス。
+    分岐リストは保存用のコピーをキャッシュするため、変更は add_branch などのメソッド経由で行う。
+    """
+    __slots__ = ("id", "name", "content", "x", "y", "_branches", "_branches_cache")
+
+    def __init__(self, id: Optional[str] = None, name: str = "New Scene", content: str = "",
+                 x: float = 0.0, y: float = 0.0, branches: Optional[List[Branch]] = None):
+        self.id: str = id if id is not None else os.urandom(16).hex()
+        self.name: str = name
+        self.content: str = content
+        self.x: float = x
+        self.y: float = y
+        self.branches = branches if branches is not None else []
+
+    @property
+    def branches(self) -> List[Branch]:
+        return self._branches
+
+    @branches.setter
+    def branches(self, value: List[Branch]) -> None:
+        self._branches = value
+        self._branches_cache: Optional[List[Dict[str, str]]] = None
+
+    def __repr__(self) -> str:
+        return f"Scene(id={self.id!r}, name={self.name!r}, x={self.x!r}, y={self.y!r})"
 
     def add_branch(self, text: str, target: str, condition: str = "") -> None:
-        self.branches.append({
-            "text": text,
-            "target": target,
-            "condition": condition
-        })
+        self._branches.append(Branch(text, target, condition))
+        self._branches_cache = None
+
+    def set_branch(self, index: int, branch: Branch) -> None:
+        """指定位置の分岐を置き換える"""
+        self._branches[index] = branch
+        self._branches_cache = None
+
+    def remove_branches(self, indices) -> None:
+        """指定位置の分岐を削除する（1回の走査でまとめて取り除く）"""
+        removed = set(indices)
+        if not removed:
+            return
+        branches = self._branches
+        branches[:] = [b for i, b in enumerate(branches) if i not in removed]
+        self._branches_cache = None
+
+    def remove_branches_to(self, target_id: str) -> None:
+        """指定したシーンへの分岐を全て削除する（該当が無ければ何もしない）"""
+        branches = self._branches
+        if any(b.target == target_id for b in branches):
+            branches[:] = [b for b in branches if b.target != target_id]
+            self._branches_cache = None
 
     def to_dict(self) -> Dict[str, Any]:
+        # 分岐が変更されていなければ前回の保存用リストを使い回す
+        if self._branches_cache is None:
+            self._branches_cache = list(map(Branch.to_dict, self._branches))
         return {
             "id": self.id,
             "name": self.name,
             "content": self.content,
             "x": self.x,
             "y": self.y,
-            "branches": self.branches.copy()
+            "branches": self._branches_cache
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Scene':
+        # IDが無い場合のみ__init__側で新規IDを生成する
+        get = data.get
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
-            name=data.get("name", "Unnamed Scene"),
-            content=data.get("content", ""),
-            x=float(data.get("x", 0.0)),
-            y=float(data.get("y", 0.0)),
-            branches=data.get("branches", [])
+            id=get("id"),
+            name=get("name", "Unnamed Scene"),
+            content=get("content", ""),
+            x=float(get("x", 0.0)),
+            y=float(get("y", 0.0)),
+            branches=[Branch.from_dict(b) for b in get("branches", [])]
         )
 
+# --- プロジェクトファイルの読み書き ---
+def encode_project_data(data: Dict[str, Any], compact: bool = False) -> bytes:
+    """プロジェクトデータをUTF-8のJSONバイト列に変換（orjsonがあれば使用）"""
+    if orjson is not None:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # 文字列以外のキーを持つプラグインデータがある場合だけ、低速なキー変換を有効にして再試行
+            return orjson.dumps(data, option=option | orjson.OPT_NON_STR_KEYS)
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+def decode_project_data(raw: bytes) -> Any:
+    """JSONバイト列をプロジェクトデータに変換（gzip圧縮されていれば展開する）"""
+    if raw[:2] == GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # --- ユーティリティクラス ---
 class Tooltip:
     def __init__(self, widget, text):
@@ -226,6 +395,13 @@ class TextWithLineNumbers(tk.Frame):
 
 # --- プラグインシステム ---
 class IPlugin:
+    # モジュール名 -> そのモジュールで最初に定義されたIPluginのサブクラス
+    _subclasses_by_module: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        IPlugin._subclasses_by_module.setdefault(cls.__module__, cls)
+
     def __init__(self, app: 'NovelGameEditor'):
         self.app = app
         self.state = PluginState.UNLOADED
@@ -246,6 +422,8 @@ class PluginManager:
     def __init__(self, app: 'NovelGameEditor'):
         self.app = app
         self.plugins: Dict[str, IPlugin] = {}
+        self._discovery_mtime_ns: Optional[int] = None  # 前回探索時のディレクトリ更新時刻
+        self._plugin_entries: Dict[str, str] = {}  # プラグイン名 -> ファイルパス（探索結果）
         self._setup_plugin_path()
 
     def _setup_plugin_path(self):
@@ -264,22 +442,34 @@ class PluginManager:
         self.plugin_dir = script_dir / "plugins"
         print(f"[プラグインマネージャ] プラグインディレクトリ: '{self.plugin_dir}'")
         self.plugin_dir.mkdir(exist_ok=True)
+        # ディレクトリの内容をキャッシュするファインダーを使い回す（.pyのみ対象）
+        self._finder = importlib.machinery.FileFinder(
+            str(self.plugin_dir), (importlib.machinery.SourceFileLoader, [".py"])
+        )
 
     def discover_plugins(self) -> List[str]:
         """利用可能なプラグインを探索"""
         print(f"[プラグインマネージャ] '{self.plugin_dir}' 内のプラグインを探索中...")
         
-        if not self.plugin_dir.exists():
+        try:
+            dir_mtime_ns = self.plugin_dir.stat().st_mtime_ns
+        except OSError:
             print(f"[プラグインマネージャ] ディレクトリが見つかりません。")
             return []
 
-        plugin_files = list(self.plugin_dir.glob("*.py"))
-        print(f"[プラグインマネージャ] 発見したPythonファイル: {[f.name for f in plugin_files]}")
+        # ファイルの追加・削除が無ければ前回の探索結果を使い回す
+        if self._discovery_mtime_ns == dir_mtime_ns:
+            return list(self._plugin_entries)
 
-        found_plugins = [
-            f.stem for f in plugin_files 
-            if f.is_file() and not f.name.startswith("_")
-        ]
+        # os.scandirはエントリごとのPath生成が無く、ファイル種別もreaddirの結果から判定できる。
+        # パスも一緒に記録しておき、ロード時にディレクトリを再度調べずに済ませる
+        with os.scandir(self.plugin_dir) as entries:
+            self._plugin_entries = {
+                e.name[:-3]: e.path for e in entries
+                if e.name.endswith(".py") and not e.name.startswith("_") and e.is_file()
+            }
+        self._discovery_mtime_ns = dir_mtime_ns
+        found_plugins = list(self._plugin_entries)
         print(f"[プラグインマネージャ] ロード対象プラグイン: {found_plugins}")
         return found_plugins
 
@@ -305,36 +495,37 @@ class PluginManager:
         if plugin_name in self.plugins:
             return False
 
-        plugin_file = self.plugin_dir / f"{plugin_name}.py"
-        if not plugin_file.exists():
-            self._log(f"プラグインファイル '{plugin_file}' が見つかりません。")
+        # 探索済みならそのパスから直接specを作る（未探索の名前のみファインダーで探す）
+        plugin_path = self._plugin_entries.get(plugin_name)
+        if plugin_path is not None:
+            spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+        else:
+            spec = self._finder.find_spec(plugin_name)
+        if spec is None or spec.loader is None:
+            self._log(f"プラグインファイル '{self.plugin_dir / f'{plugin_name}.py'}' が見つかりません。")
             return False
 
         try:
             # IPluginをプラグインの名前空間に事前注入してimportエラーを防ぐ
-            spec = importlib.util.spec_from_file_location(plugin_name, plugin_file)
             module = importlib.util.module_from_spec(spec)
             module.__dict__['IPlugin'] = IPlugin
             sys.modules[plugin_name] = module
+            IPlugin._subclasses_by_module.pop(plugin_name, None)
             spec.loader.exec_module(module)
 
-            for _, obj in inspect.getmembers(module, inspect.isclass):
-                if obj.__module__ != plugin_name:
-                    continue
-                # クラス名ベースのMROチェック（frozen環境でのクラス同一性問題を回避）
-                mro_names = [c.__name__ for c in obj.__mro__]
-                if 'IPlugin' not in mro_names or obj.__name__ == 'IPlugin':
-                    continue
-
-                plugin_instance = obj(self.app)
-                plugin_instance.setup()
-                plugin_instance.register()
+            # 定義時に登録されたサブクラスを使い、見つからない場合のみ名前空間を走査する
+            plugin_class = IPlugin._subclasses_by_module.get(plugin_name) or self._find_plugin_class(module)
+            if plugin_class is None:
+                self._log(f"プラグイン '{plugin_name}': IPluginのサブクラスが見つかりませんでした。")
+                return False
 
-                self.plugins[plugin_name] = plugin_instance
-                self._log(f"プラグイン '{plugin_name}' をロードしました。")
-                return True
+            plugin_instance = plugin_class(self.app)
+            plugin_instance.setup()
+            plugin_instance.register()
 
-            self._log(f"プラグイン '{plugin_name}': IPluginのサブクラスが見つかりませんでした。")
+            self.plugins[plugin_name] = plugin_instance
+            self._log(f"プラグイン '{plugin_name}' をロードしました。")
+            return True
 
         except Exception as e:
             import traceback
@@ -343,6 +534,17 @@ class PluginManager:
                 del sys.modules[plugin_name]
             return False
 
+    @staticmethod
+    def _find_plugin_class(module) -> Optional[type]:
+        """モジュールの名前空間からIPluginのサブクラスを探す（別のIPluginを継承している場合用）"""
+        for obj in list(vars(module).values()):
+            if not isinstance(obj, type) or obj.__module__ != module.__name__:
+                continue
+            # クラス名ベースのMROチェック（frozen環境でのクラス同一性問題を回避）
+            if obj.__name__ != 'IPlugin' and any(c.__name__ == 'IPlugin' for c in obj.__mro__):
+                return obj
+        return None
+
     def unload_plugin(self, plugin_name: str) -> bool:
         """プラグインのアンロード"""
         if plugin_name not in self.plugins:
@@ -351,6 +553,7 @@ class PluginManager:
         try:
             self.plugins[plugin_name].teardown()
             del self.plugins[plugin_name]
+            IPlugin._subclasses_by_module.pop(plugin_name, None)
             
             if plugin_name in sys.modules:
                 del sys.modules[plugin_name]
@@ -364,8 +567,19 @@ class PluginManager:
 
 # --- 設定管理 ---
 class ConfigManager:
+    _SHORTCUT_SEPARATOR_RE = re.compile(r'[-+]')  # "Control-S" と "Control+S" の両方を受け付ける
+    _MODIFIERS = frozenset(('control', 'alt', 'shift'))
+
     def __init__(self):
-        self.config = configparser.ConfigParser()
+        # 値に%を含むパス等をそのまま扱えるよう、補間は行わない
+        self.config = configparser.ConfigParser(interpolation=None)
+        self._shortcuts: Dict[str, str] = {}  # SHORTCUTSセクションの内容（参照はこの辞書から行う）
+        self._display_cache: Dict[str, str] = {}  # アクション -> 表示用ショートカット文字列
+        self._binding_cache: Dict[str, str] = {}  # アクション -> tkinterのbind用シーケンス
+        self._plugin_enabled: Dict[str, bool] = {}  # PLUGINSセクションの内容
+        self.compact_project_json = False  # .ngpを改行・インデント無しのJSONで保存するか
+        self._config_mtime_ns: Optional[int] = None  # 最後に読み書きした時点のファイル更新時刻
+        self.reload_listeners: List[Callable[[], None]] = []  # reload_if_changedで読み直した後に呼ぶ関数
         if getattr(sys, 'frozen', False):
             base_dir = Path(sys.executable).parent
         else:
@@ -378,52 +592,134 @@ class ConfigManager:
 
     def _load_config(self) -> None:
         """設定ファイルの読み込み"""
-        self.config.read(self.config_file, encoding='utf-8')
-        
-        default_shortcuts = {
-            'new_project': 'Control-N',
-            'open_project': 'Control-O',
-            'save_project': 'Control-S',
-            'save_project_as': 'Control-Shift-S',
-            'add_scene': 'Control-A',
-            'add_branch': 'Control-B',
-            'zoom_in': 'Control-plus',
-            'zoom_out': 'Control-minus',
-            'reset_view': 'Control-0'
-        }
+        # ファイルが無い場合と既定値を補った場合のみ書き戻す（通常の起動ではファイルに書き込まない）
+        changed = not self.config.read(self.config_file, encoding='utf-8')
+        self._config_mtime_ns = self._file_mtime_ns()
         
         if not self.config.has_section('SHORTCUTS'):
             self.config.add_section('SHORTCUTS')
+            changed = True
             
-        for key, value in default_shortcuts.items():
+        for key, value in DEFAULT_SHORTCUTS.items():
             if not self.config.has_option('SHORTCUTS', key):
                 self.config.set('SHORTCUTS', key, value)
+                changed = True
                 
         if not self.config.has_section('RECENT_FILES'):
             self.config.add_section('RECENT_FILES')
+            changed = True
             
-        self._save_config()
+        # 頻繁に参照される設定は起動時に辞書へ展開しておく
+        self._shortcuts = dict(self.config.items('SHORTCUTS'))
+        try:
+            self.compact_project_json = self.config.getboolean('PROJECT', 'compact_json', fallback=False)
+        except ValueError:
+            # fallbackは項目が無い場合にしか効かないため、不正な値は既定値（整形して保存）として扱う
+            print("[設定] PROJECTの 'compact_json' の値が不正なため、無効として扱います。")
+            self.compact_project_json = False
+        if self.config.has_section('PLUGINS'):
+            for name in self.config.options('PLUGINS'):
+                try:
+                    self._plugin_enabled[name] = self.config.getboolean('PLUGINS', name)
+                except ValueError:
+                    # 不正な値で起動できなくならないよう、そのプラグインは有効として扱う
+                    print(f"[設定] PLUGINSの '{name}' の値が不正なため、有効として扱います。")
+                    self._plugin_enabled[name] = True
+        if changed:
+            self._save_config()
 
     def _save_config(self) -> None:
         """設定ファイルの保存"""
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            self.config.write(f)
+        # configparserは細かい単位で書き込むため、一旦メモリ上で組み立ててから1回で書き出す
+        buffer = io.StringIO()
+        self.config.write(buffer)
+        self.config_file.write_bytes(buffer.getvalue().encode('utf-8'))
+        self._config_mtime_ns = self._file_mtime_ns()
+
+    def _file_mtime_ns(self) -> Optional[int]:
+        """設定ファイルの更新時刻（ファイルが無ければNone）"""
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+        """設定ファイルが外部で更新されていた場合のみ読み直す（stat 1回で判定）"""
+        if self._file_mtime_ns() == self._config_mtime_ns:
+            return False
+        # プラグインが参照を保持している可能性があるため、ConfigParser自体は作り直さない
+        for section in self.config.sections():
+            self.config.remove_section(section)
+        self.config.defaults().clear()
+        self._display_cache.clear()
+        self._binding_cache.clear()
+        self._plugin_enabled = {}
+        self._load_config()
+        # ショートカット等のキャッシュを破棄したので、バインドやメニュー表示も設定に合わせ直してもらう
+        for listener in self.reload_listeners:
+            listener()
+        return True
 
     def get_shortcut(self, action: str) -> str:
         """ショートカットキーの取得"""
-        return self.config.get('SHORTCUTS', action, fallback='')
+        return self._shortcuts.get(action, '')
 
     def set_shortcut(self, action: str, shortcut: str) -> None:
         """ショートカットキーの設定"""
+        self.set_shortcuts({action: shortcut})
+
+    def set_shortcuts(self, shortcuts: Dict[str, str]) -> None:
+        """複数のショートカットキーをまとめて設定（ファイルへの書き込みは1回、変更が無ければ書き込まない）"""
+        changed = {action: shortcut for action, shortcut in shortcuts.items()
+                   if self._shortcuts.get(action) != shortcut}
+        if not changed:
+            return
+            
         if not self.config.has_section('SHORTCUTS'):
             self.config.add_section('SHORTCUTS')
             
-        self.config.set('SHORTCUTS', action, shortcut)
+        for action, shortcut in changed.items():
+            self.config.set('SHORTCUTS', action, shortcut)
+            self._shortcuts[action] = shortcut
+            self._display_cache.pop(action, None)
+            self._binding_cache.pop(action, None)
         self._save_config()
 
     def get_shortcut_display(self, action: str) -> str:
         """表示用のショートカット文字列を取得"""
-        return self.get_shortcut(action).replace('-', '+')
+        display = self._display_cache.get(action)
+        if display is None:
+            display = self._display_cache[action] = self.get_shortcut(action).replace('-', '+')
+        return display
+
+    def get_tk_binding(self, action: str) -> str:
+        """tkinterのbind用のシーケンス（例: <Control-n>）を取得。未設定なら空文字"""
+        binding = self._binding_cache.get(action)
+        if binding is None:
+            binding = self._binding_cache[action] = self._to_tk_binding(self.get_shortcut(action))
+        return binding
+
+    @staticmethod
+    def _to_tk_binding(shortcut: str) -> str:
+        """設定ファイル形式のショートカット文字列をtkinterのシーケンスに変換"""
+        if not shortcut:
+            return ''
+            
+        *modifier_parts, key = ConfigManager._SHORTCUT_SEPARATOR_RE.split(shortcut)
+        modifiers = sorted([p.capitalize() for p in modifier_parts if p.lower() in ConfigManager._MODIFIERS])
+        key = key.lower()
+
+        if not key:
+            return ''
+
+        # Shift + 英字の場合: <Control-Shift-s> はShift押下時にkeysymが'S'になるため
+        # 発火しない。<Control-S> 形式（大文字）に変換して正しく動作させる
+        if 'Shift' in modifiers and len(key) == 1 and key.isalpha():
+            modifiers = [m for m in modifiers if m != 'Shift']
+            key = key.upper()
+
+        # tkinterのフォーマットに変換（'plus' や 'minus' などのキー名はそのままkeysymとして使える）
+        return f"<{'-'.join(modifiers + [key])}>"
 
     def get_recent_files(self) -> List[Path]:
         """最近使ったファイルのリストを取得"""
@@ -465,13 +761,13 @@ class ConfigManager:
 
     def is_plugin_enabled(self, plugin_name: str) -> bool:
         """プラグインが有効かどうかを確認"""
-        self._ensure_plugin_section()
-        return self.config.getboolean('PLUGINS', plugin_name, fallback=True)
+        return self._plugin_enabled.get(self.config.optionxform(plugin_name), True)
 
     def set_plugin_enabled(self, plugin_name: str, enabled: bool):
         """プラグインの有効/無効を設定"""
         self._ensure_plugin_section()
         self.config.set('PLUGINS', plugin_name, 'true' if enabled else 'false')
+        self._plugin_enabled[self.config.optionxform(plugin_name)] = enabled
         self._save_config()
 
 # --- UIダイアログ ---
@@ -496,19 +792,7 @@ class SettingsDialog(tk.Toplevel):
             row=0, column=0, columnspan=2, pady=10
         )
         
-        shortcut_actions = {
-            'new_project': "新規プロジェクト",
-            'open_project': "プロジェクトを開く",
-            'save_project': "プロジェクトを保存",
-            'save_project_as': "名前を付けて保存",
-            'add_scene': "シーンを追加",
-            'add_branch': "分岐を追加",
-            'zoom_in': "ズームイン",
-            'zoom_out': "ズームアウト",
-            'reset_view': "ビューをリセット"
-        }
-        
-        for i, (action_key, action_label) in enumerate(shortcut_actions.items(), 1):
+        for i, (action_key, action_label) in enumerate(SHORTCUT_ACTIONS, 1):
             ttk.Label(main_frame, text=f"{action_label}:").grid(
                 row=i, column=0, sticky=tk.W, padx=5, pady=2
             )
@@ -519,15 +803,15 @@ class SettingsDialog(tk.Toplevel):
             self.shortcut_entry_widgets[action_key] = entry
         
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=len(shortcut_actions) + 1, column=0, columnspan=2, pady=15)
+        button_frame.grid(row=len(SHORTCUT_ACTIONS) + 1, column=0, columnspan=2, pady=15)
         
         ttk.Button(button_frame, text="保存", command=self._save_settings).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="キャンセル", command=self.destroy).pack(side=tk.LEFT, padx=5)
 
     def _save_settings(self) -> None:
         """設定を保存"""
-        for action_key, entry_widget in self.shortcut_entry_widgets.items():
-            self.config_manager.set_shortcut(action_key, entry_widget.get().strip())
+        shortcuts = {key: entry.get().strip() for key, entry in self.shortcut_entry_widgets.items()}
+        self.config_manager.set_shortcuts(shortcuts)
             
         if self.on_save_callback:
             self.on_save_callback()
@@ -536,7 +820,7 @@ class SettingsDialog(tk.Toplevel):
         self.destroy()
 
 class SceneSelectionDialog(tk.Toplevel):
-    def __init__(self, parent, scenes: List[Scene], title="シーンを選択"):
+    def __init__(self, parent, scenes: List[Scene], title="シーンを選択", exclude: Optional[Scene] = None):
         super().__init__(parent)
         self.title(title)
         self.transient(parent)
@@ -544,6 +828,13 @@ class SceneSelectionDialog(tk.Toplevel):
         self.result: Optional[str] = None
         self.scenes = scenes
         self.listbox_scenes: List[Scene] = []  # 表示されているシーンオブジェクトを順番に保持
+        # 検索用に小文字化したシーン名を一度だけ作っておく（除外するシーンもここで取り除く）
+        self._search_index: List[Tuple[str, Scene]] = [
+            (scene.name.lower(), scene) for scene in scenes if scene is not exclude
+        ]
+        # 前回の検索語とその一致結果（検索語を書き足した場合は、この中だけを絞り込む）
+        self._last_search_term = ""
+        self._last_matches = self._search_index
         self._create_widgets()
         self._update_listbox()
         self.resizable(False, False)
@@ -580,11 +871,14 @@ class SceneSelectionDialog(tk.Toplevel):
         self.listbox_scenes.clear()  # リストをクリア
         
         search_term = self.search_var.get().lower()
+        candidates = self._last_matches if self._last_search_term in search_term else self._search_index
+        matches = [(lower_name, scene) for lower_name, scene in candidates if search_term in lower_name]
+        self._last_search_term, self._last_matches = search_term, matches
         
-        for scene in self.scenes:
-            if search_term in scene.name.lower():
-                self.listbox.insert(tk.END, scene.name)
-                self.listbox_scenes.append(scene)  # 表示するシーンオブジェクトをリストに追加
+        self.listbox_scenes.extend(scene for _, scene in matches)  # 表示するシーンオブジェクトを順番に保持
+                
+        if self.listbox_scenes:
+            self.listbox.insert(tk.END, *(scene.name for scene in self.listbox_scenes))
     
     def _on_ok(self, event=None):
         selected_indices = self.listbox.curselection()
@@ -635,7 +929,7 @@ class BranchDialog(tk.Toplevel):
         )
         
         self.target_scene_var = tk.StringVar()
-        target_scene = next((s for s in self.all_scenes if s.id == self.target_id), None)
+        target_scene = self.app.get_scene_by_id(self.target_id)
         if target_scene:
             self.target_scene_var.set(target_scene.name)
             
@@ -662,9 +956,9 @@ class BranchDialog(tk.Toplevel):
         ttk.Button(btn_frame, text="キャンセル", command=self.destroy).pack(side=tk.LEFT, padx=5)
     
     def _select_scene(self):
-        available_scenes = [s for s in self.all_scenes if s.id != self.source_scene.id]
+        source_scene = self.source_scene
         
-        if not available_scenes:
+        if not any(s is not source_scene for s in self.all_scenes):
             if messagebox.askyesno(
                 "確認", 
                 "遷移可能なシーンがありません。\n新しいシーンを作成して遷移先にしますか？", 
@@ -677,10 +971,11 @@ class BranchDialog(tk.Toplevel):
                     self.target_scene_var.set(new_scene.name)
             return
             
-        dialog = SceneSelectionDialog(self, available_scenes)
+        # 遷移元シーンの除外は検索用の索引を作る際にまとめて行う
+        dialog = SceneSelectionDialog(self, self.all_scenes, exclude=source_scene)
         if dialog.result:
             self.target_id = dialog.result
-            selected_scene = next((s for s in self.all_scenes if s.id == self.target_id), None)
+            selected_scene = self.app.get_scene_by_id(self.target_id)
             if selected_scene:
                 self.target_scene_var.set(selected_scene.name)
     
@@ -775,38 +1070,66 @@ class NovelGameEditor:
         self.plugin_manager = PluginManager(self)
         self._base_title = "ノベルゲーム制作支援ツール"
         self._is_loading = False
+        self._content_dirty = False  # 本文がシーンに未反映の変更を含むか
         
         # データ状態
         self.pluggable_data_keys: Dict[str, Any] = {}
         self.project_data: Dict[str, Any] = {}
         self.scenes: List[Scene] = []
+        self._scene_by_id: Dict[str, Scene] = {}
+        self._incoming: Dict[str, Dict[str, int]] = {}  # 遷移先ID -> {遷移元ID: 分岐数}
+        self._scene_grid: Dict[Tuple[int, int], List[Scene]] = {}  # グリッドのセル -> そのセルにあるシーン
         self.selected_scene: Optional[Scene] = None
         self.current_project_path: Optional[Path] = None
         self.is_dirty = False
+        self._save_after_id: Optional[str] = None
+        self._save_thread: Optional[threading.Thread] = None
+        self._save_job: Optional[Dict[str, Any]] = None
+        self._last_saved: Optional[Tuple[Path, bytes, int]] = None  # (パス, 内容のハッシュ, 更新時刻)
+        self._last_backup_digest: Optional[bytes] = None  # 最後にバックアップした内容のハッシュ
         
         # ビュー状態
         self.scale = DEFAULT_ZOOM
         self.view_offset_x = 0.0
         self.view_offset_y = 0.0
         self.drag_state = {}
+        self._drag_pending = False
+        self._restyle_pending = False
+        self._incident_branch_items: Dict[str, List[Tuple[Scene, Scene, int, int, int]]] = {}
+        self._branch_label_items: Dict[Tuple[str, int], Tuple[int, int]] = {}  # (シーンID, 分岐番号) -> (テキスト, 条件)
+        self._item_to_scene: Dict[int, Scene] = {}
+        self._branch_list_scene: Optional[Scene] = None
+        self._branch_row_values: List[Tuple[str, str, str]] = []  # 分岐リストの各行に表示中の値
+        self._branch_row_branches: List[Branch] = []  # 分岐リストの各行に表示中の分岐オブジェクト
+        self._branch_buttons_state: Optional[str] = None  # 編集・削除ボタンに設定済みの状態
         
         # UIコンポーネント
         self.menubar = tk.Menu(self.root)
         self.plugin_menu: Optional[tk.Menu] = None
         self.recent_files_menu: Optional[tk.Menu] = None
-        self.bound_shortcuts: List[str] = []  # バインドされたショートカットを追跡するリスト
+        self._context_menu: Optional[tk.Menu] = None  # キャンバスの右クリックメニュー（初回表示時に作成）
+        self._context_menu_has_scene_entry = False
+        self._context_menu_pos: Tuple[float, float] = (0.0, 0.0)
+        self.bound_shortcuts: Dict[str, str] = {}  # バインド済みのシーケンス -> アクション
+        self._menu_accelerators: Dict[str, str] = {}  # アクション -> メニューに表示中のショートカット
         
         # 初期セットアップ
         self._create_widgets()
         self._bind_events()
         self.setup_shortcuts()
-        self._load_plugins()
+        self.config_manager.reload_listeners.append(self._on_config_reloaded)
         self.new_project(startup=True)
         self._update_status_bar()
+        # プラグインの読み込みはウィンドウを表示してから行う
+        self.root.after_idle(self._load_plugins)
 
     # --- 公開メソッド ---
     def register_data_key(self, key: str, default_value: Any):
-        """プラグインが使用するデータキーを登録"""
+        """
+        プラグインが使用するデータキーを登録。
+        保存はバックグラウンドスレッドで行われ、最上位のリスト・辞書しか複製されないため、
+        登録したデータの入れ子の要素（リスト内の辞書など）はその場で書き換えず、新しいオブジェクトに置き換えること。
+        """
         if key in self.pluggable_data_keys or key == "scenes":
             print(f"警告: データキー '{key}' は既に登録済みか、予約されています。")
             return
@@ -836,9 +1159,47 @@ class NovelGameEditor:
 
     def get_scene_by_id(self, scene_id: str) -> Optional[Scene]:
         """IDでシーンを取得"""
-        return next((s for s in self.scenes if s.id == scene_id), None)
+        return self._scene_by_id.get(scene_id)
 
     # --- プライベートメソッド ---
+    def _rebuild_scene_index(self):
+        """IDからシーンを引くための索引を再構築"""
+        self._scene_by_id = {s.id: s for s in self.scenes}
+        self._scene_grid = {}
+        for scene in self.scenes:
+            self._grid_insert(scene)
+        self._incoming = {}
+        for scene in self.scenes:
+            self._track_branches(scene, (b.target for b in scene.branches), 1)
+
+    @staticmethod
+    def _grid_cell(x: float, y: float) -> Tuple[int, int]:
+        """ワールド座標が属するグリッドのセルを返す"""
+        return int(x // NODE_GRID_CELL_SIZE), int(y // NODE_GRID_CELL_SIZE)
+
+    def _grid_insert(self, scene: Scene):
+        """シーンを当たり判定用グリッドに登録"""
+        self._scene_grid.setdefault(self._grid_cell(scene.x, scene.y), []).append(scene)
+
+    def _grid_remove(self, scene: Scene, x: float, y: float):
+        """座標 (x, y) に登録されていたシーンをグリッドから外す"""
+        cell = self._grid_cell(x, y)
+        bucket = self._scene_grid.get(cell)
+        if bucket and scene in bucket:
+            bucket.remove(scene)
+            if not bucket:
+                del self._scene_grid[cell]
+
+    def _track_branches(self, source: Scene, target_ids, delta: int):
+        """遷移先ID -> {遷移元ID: 分岐数} の逆引き索引を更新"""
+        for target_id in target_ids:
+            sources = self._incoming.setdefault(target_id, {})
+            count = sources.get(source.id, 0) + delta
+            if count > 0:
+                sources[source.id] = count
+            else:
+                sources.pop(source.id, None)
+
     def _create_widgets(self):
         """UIウィジェットの作成"""
         self.root.config(menu=self.menubar)
@@ -873,8 +1234,8 @@ class NovelGameEditor:
         
         # ファイルメニュー
         self.file_menu = tk.Menu(self.menubar, tearoff=0)
-        self.file_menu.add_command(label="新規", command=self.new_project)
-        self.file_menu.add_command(label="開く...", command=self.open_project)
+        self.file_menu.add_command(label="新規", command=partial(self._run_action, 'new_project'))
+        self.file_menu.add_command(label="開く...", command=partial(self._run_action, 'open_project'))
         
         self.recent_files_menu = tk.Menu(self.file_menu, tearoff=0)
         self.file_menu.add_cascade(label="最近使ったプロジェクトを開く", menu=self.recent_files_menu)
@@ -906,6 +1267,8 @@ class NovelGameEditor:
         self.menubar.add_cascade(label="プラグイン", menu=self.plugin_menu, state="disabled")
         
         self._update_recent_files_menu()
+        # メニューを作り直したので、設定済みのアクセラレータの記録も初期化する
+        self._menu_accelerators = {}
         self._update_menu_accelerators()
 
     def _create_editor_widgets(self, parent_frame):
@@ -1059,19 +1422,22 @@ class NovelGameEditor:
             factor = 1.1 if direction > 0 else 1/1.1
             self._zoom(factor, event.x, event.y)
         elif is_shift_pressed:
-            self.view_offset_x += SCROLL_SPEED * direction / self.scale
-            self._redraw_canvas()
+            self._scroll_view(SCROLL_SPEED * direction, 0)
         else:
-            self.view_offset_y += SCROLL_SPEED * direction / self.scale
-            self._redraw_canvas()
+            self._scroll_view(0, SCROLL_SPEED * direction)
+
+    def _scroll_view(self, dx_screen: float, dy_screen: float):
+        """ビューをスクロール（描画済みのアイテムを移動するだけで再描画はしない）"""
+        self.view_offset_x += dx_screen / self.scale
+        self.view_offset_y += dy_screen / self.scale
+        self.canvas.move("all", dx_screen, dy_screen)
 
     def _on_canvas_press(self, event):
         """キャンバス上でマウスボタンが押された時の処理"""
         self.canvas.focus_set()
-        self.canvas.scan_mark(event.x, event.y)
 
         cx, cy = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
-        node_id, is_edge = self._get_node_at_with_edge(cx, cy)
+        node_id, is_edge = self._get_node_at_with_edge(cx, cy, at_pointer=True)
 
         if node_id:
             scene = self.get_scene_by_id(node_id)
@@ -1108,37 +1474,59 @@ class NovelGameEditor:
 
     def _on_canvas_drag(self, event):
         """キャンバス上でのドラッグ処理"""
-        if not self.drag_state:
+        state = self.drag_state
+        if not state:
             return
 
         # 一定距離をドラッグした場合にのみ "moved" フラグを立てる
-        if not self.drag_state.get("moved"):
-            dist_sq = (event.x - self.drag_state["start_x_screen"])**2 + \
-                     (event.y - self.drag_state["start_y_screen"])**2
+        if not state["moved"]:
+            dist_sq = (event.x - state["start_x_screen"])**2 + \
+                     (event.y - state["start_y_screen"])**2
             if dist_sq >= DRAG_THRESHOLD_SQUARED:
-                self.drag_state["moved"] = True
+                state["moved"] = True
             else:
                 return  # 閾値未満なら何もしない
 
-        drag_type = self.drag_state.get("type")
+        # ドラッグの種類はプレス時に決まっているので、文字列の比較だけで振り分ける
+        drag_type = state["type"]
+        if drag_type == "pan":
+            # パンも最新の位置だけを記録し、移動はアイドル時に1回だけ行う
+            state["target_x_screen"], state["target_y_screen"] = event.x, event.y
+            if not self._drag_pending:
+                self._drag_pending = True
+                self.root.after_idle(self._apply_pan_drag)
+            return
+            
         cx, cy = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
-        
         if drag_type == "node":
-            dx = cx - self.drag_state["last_x_canvas"]
-            dy = cy - self.drag_state["last_y_canvas"]
-
-            self.canvas.move(f"node_{self.drag_state['item_id']}", dx, dy)
-            self.drag_state["last_x_canvas"], self.drag_state["last_y_canvas"] = cx, cy
-        elif drag_type == "pan":
-            self.canvas.scan_dragto(event.x, event.y, gain=1)
+            # 最新の位置だけを記録し、移動処理はアイドル時に1回だけ行う
+            state["target_x_canvas"], state["target_y_canvas"] = cx, cy
+            if not self._drag_pending:
+                self._drag_pending = True
+                self.root.after_idle(self._apply_node_drag)
         elif drag_type == "connect":
-            self.canvas.delete("temp_connect_line")
-            source = self.get_scene_by_id(self.drag_state["source_id"])
-            if source:
-                sx, sy = self._world_to_screen(source.x, source.y)
-                target_id, _ = self._get_node_at_with_edge(cx, cy)
-                line_color = "#87CEFA" if target_id and target_id != self.drag_state["source_id"] else "#AAAAAA"
-                self.canvas.create_line(
+            # 接続線のプレビューもノードの移動と同様に、アイドル時に最新の位置で1回だけ更新する
+            state["target_x_canvas"], state["target_y_canvas"] = cx, cy
+            if not self._drag_pending:
+                self._drag_pending = True
+                self.root.after_idle(self._apply_connect_drag)
+
+    def _apply_connect_drag(self):
+        """記録されたドラッグ位置まで接続線のプレビューを伸ばす"""
+        self._drag_pending = False
+        state = self.drag_state
+        if state.get("type") != "connect" or "target_x_canvas" not in state:
+            return
+            
+        cx, cy = state["target_x_canvas"], state["target_y_canvas"]
+        source = self.get_scene_by_id(state["source_id"])
+        if source:
+            sx, sy = self._world_to_screen(source.x, source.y)
+            target_id, _ = self._get_node_at_with_edge(cx, cy)
+            line_color = "#87CEFA" if target_id and target_id != state["source_id"] else "#AAAAAA"
+            line_id = state.get("line_id")
+            if line_id is None:
+                state["line_id"] = self.canvas.create_line(
                     sx, sy, cx, cy,
                     fill=line_color,
                     width=max(1.5, 2 * self.scale),
@@ -1146,6 +1534,51 @@ class NovelGameEditor:
                     arrow=tk.LAST,
                     tags="temp_connect_line"
                 )
+            else:
+                # 作成済みの線を作り直さず、終点と色だけを更新する
+                self.canvas.coords(line_id, sx, sy, cx, cy)
+                if line_color != state.get("line_color"):
+                    self.canvas.itemconfig(line_id, fill=line_color)
+            state["line_color"] = line_color
+
+    def _apply_pan_drag(self):
+        """記録されたドラッグ位置までビューを移動"""
+        self._drag_pending = False
+        state = self.drag_state
+        if state.get("type") != "pan" or "target_x_screen" not in state:
+            return
+            
+        # ビューのオフセットを更新し、描画済みのアイテムをまとめて平行移動する
+        # （scan_dragtoと違いキャンバス座標とウィンドウ座標がずれないため、ズームや追加位置の計算がそのまま使える）
+        x, y = state["target_x_screen"], state["target_y_screen"]
+        last_x = state.get("last_x_screen", state["start_x_screen"])
+        last_y = state.get("last_y_screen", state["start_y_screen"])
+        self._scroll_view(x - last_x, y - last_y)
+        state["last_x_screen"], state["last_y_screen"] = x, y
+
+    def _apply_node_drag(self):
+        """記録されたドラッグ位置までノードと接続している分岐線を移動"""
+        self._drag_pending = False
+        if self.drag_state.get("type") != "node" or "target_x_canvas" not in self.drag_state:
+            return
+            
+        cx, cy = self.drag_state["target_x_canvas"], self.drag_state["target_y_canvas"]
+        dx = cx - self.drag_state["last_x_canvas"]
+        dy = cy - self.drag_state["last_y_canvas"]
+
+        self.canvas.move(f"node_{self.drag_state['item_id']}", dx, dy)
+        self.drag_state["last_x_canvas"], self.drag_state["last_y_canvas"] = cx, cy
+        
+        # 接続している分岐線もノードに追従させる（キャンバス全体は再描画しない）
+        scene = self.get_scene_by_id(self.drag_state["item_id"])
+        if scene:
+            old_x, old_y = scene.x, scene.y
+            scene.x = self.drag_state["original_x_world"] + (cx - self.drag_state["start_x_canvas"]) / self.scale
+            scene.y = self.drag_state["original_y_world"] + (cy - self.drag_state["start_y_canvas"]) / self.scale
+            if self._grid_cell(old_x, old_y) != self._grid_cell(scene.x, scene.y):
+                self._grid_remove(scene, old_x, old_y)
+                self._grid_insert(scene)
+            self._update_branch_items_for(scene.id)
 
     def _on_canvas_release(self, event):
         """キャンバス上でマウスボタンが離された時の処理"""
@@ -1164,16 +1597,14 @@ class NovelGameEditor:
             elif drag_type == "pan":
                 self.select_scene(None)
         elif drag_type == "node":
-            scene = self.get_scene_by_id(self.drag_state["item_id"])
-            if scene:
-                total_dx_canvas = cx - self.drag_state["start_x_canvas"]
-                total_dy_canvas = cy - self.drag_state["start_y_canvas"]
-
-                scene.x = self.drag_state["original_x_world"] + (total_dx_canvas / self.scale)
-                scene.y = self.drag_state["original_y_world"] + (total_dy_canvas / self.scale)
-
-                self._mark_dirty()
-                self._redraw_canvas()
+            # ドラッグ中の移動でノードと分岐線は追従済みなので、最終位置を反映するだけでよい
+            self.drag_state["target_x_canvas"], self.drag_state["target_y_canvas"] = cx, cy
+            self._apply_node_drag()
+            self._mark_dirty()
+        elif drag_type == "pan":
+            # アイドル時の移動を待たずに、離した位置までのパンを反映する
+            self.drag_state["target_x_screen"], self.drag_state["target_y_screen"] = event.x, event.y
+            self._apply_pan_drag()
         elif drag_type == "connect":
             self.canvas.delete("temp_connect_line")
             target_id, _ = self._get_node_at_with_edge(cx, cy)
@@ -1193,9 +1624,10 @@ class NovelGameEditor:
                     )
                     if dialog.result:
                         source.add_branch(**dialog.result)
+                        self._track_branches(source, (dialog.result["target"],), 1)
                         self._mark_dirty()
                         self._update_branch_list()
-                        self._redraw_canvas()
+                        self._redraw_branches()
 
         self.canvas.delete("temp_connect_line")
         self.drag_state = {}
@@ -1205,7 +1637,7 @@ class NovelGameEditor:
         if self.drag_state:
             return
         cx, cy = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
-        _, is_edge = self._get_node_at_with_edge(cx, cy)
+        _, is_edge = self._get_node_at_with_edge(cx, cy, at_pointer=True)
         self.canvas.config(cursor="crosshair" if is_edge else "")
 
     def _on_canvas_double_click(self, event):
@@ -1216,54 +1648,81 @@ class NovelGameEditor:
 
     def _on_canvas_right_click(self, event):
         """キャンバス上の右クリック処理"""
-        context_menu = tk.Menu(self.root, tearoff=0)
+        context_menu = self._get_context_menu()
         cx, cy = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
-        clicked_node_id = self._get_node_id_at(cx, cy)
-        
-        if clicked_node_id:
-            scene = self.get_scene_by_id(clicked_node_id)
-            if scene:
-                if scene != self.selected_scene:
-                    self.select_scene(scene)
-                context_menu.add_command(
-                    label=f"シーン '{scene.name}' を削除",
-                    command=self.delete_scene
-                )
-                context_menu.add_separator()
-            
-        context_menu.add_command(
-            label="ここにシーンを追加",
-            command=lambda: self.add_scene(at_canvas_pos=(cx, cy)))
-        context_menu.add_command(
-            label="ビューをリセット",
-            command=self.reset_view)
+        self._context_menu_pos = (cx, cy)
+        clicked_node_id, _ = self._get_node_at_with_edge(cx, cy, at_pointer=True)
+        scene = self.get_scene_by_id(clicked_node_id) if clicked_node_id else None
+        
+        # メニューは使い回し、シーン削除の項目だけをクリック位置に応じて出し入れする
+        if scene:
+            if scene != self.selected_scene:
+                self.select_scene(scene)
+            label = f"シーン '{scene.name}' を削除"
+            if self._context_menu_has_scene_entry:
+                context_menu.entryconfig(0, label=label)
+            else:
+                context_menu.insert_command(0, label=label, command=self.delete_scene)
+                context_menu.insert_separator(1)
+                self._context_menu_has_scene_entry = True
+        elif self._context_menu_has_scene_entry:
+            context_menu.delete(0, 1)
+            self._context_menu_has_scene_entry = False
             
         try:
             context_menu.tk_popup(event.x_root, event.y_root)
         finally:
             context_menu.grab_release()
 
-    def _get_node_id_at(self, x: float, y: float) -> Optional[str]:
-        """指定座標にあるノードのIDを取得"""
-        items = self.canvas.find_overlapping(x - 2, y - 2, x + 2, y + 2)
-
-        for item in reversed(items):
-            tags = self.canvas.gettags(item)
-            if "node" in tags:
-                for tag in tags:
-                    if tag.startswith("node_"):
-                        return tag.split("_", 1)[1]
-        return None
-
-    def _get_node_at_with_edge(self, cx: float, cy: float) -> Tuple[Optional[str], bool]:
+    def _get_context_menu(self) -> tk.Menu:
+        """右クリックメニューを返す（初回のみ作成）"""
+        if self._context_menu is None:
+            self._context_menu = tk.Menu(self.root, tearoff=0)
+            self._context_menu.add_command(
+                label="ここにシーンを追加",
+                command=lambda: self.add_scene(at_canvas_pos=self._context_menu_pos))
+            self._context_menu.add_command(
+                label="ビューをリセット",
+                command=self.reset_view)
+        return self._context_menu
+
+    def _get_node_at_with_edge(self, cx: float, cy: float, at_pointer: bool = False) -> Tuple[Optional[str], bool]:
         """指定したキャンバス座標のノードIDと、エッジ付近（接続ゾーン）かどうかを返す"""
-        for scene in reversed(self.scenes):
-            sx, sy = self._world_to_screen(scene.x, scene.y)
-            radius = DEFAULT_NODE_RADIUS * self.scale
-            dist = math.hypot(cx - sx, cy - sy)
-            if dist <= radius * 1.2:
-                is_edge = dist >= radius * 0.55
-                return scene.id, is_edge
+        # マウス直下のアイテムはTkが "current" タグで追跡しているので、まずそれを調べる
+        if at_pointer:
+            current = self.canvas.find_withtag(tk.CURRENT)
+            if current and current[0] in self._item_to_scene:
+                hit = self._node_hit(self._item_to_scene[current[0]], cx, cy, DEFAULT_NODE_RADIUS * self.scale)
+                if hit[0]:
+                    return hit
+                    
+        # それ以外はキャンバス全体を検索せず、グリッドで周囲3x3セルのノードだけを調べる
+        wx, wy = self._screen_to_world(cx, cy)
+        col, row = self._grid_cell(wx, wy)
+        grid = self._scene_grid
+        hits: Dict[Scene, float] = {}
+        for cell in ((col + dc, row + dr) for dc in (-1, 0, 1) for dr in (-1, 0, 1)):
+            for scene in grid.get(cell, ()):
+                dist = math.hypot(scene.x - wx, scene.y - wy)
+                if dist <= NODE_HIT_RADIUS:
+                    hits[scene] = dist
+                    
+        if not hits:
+            return None, False
+        if len(hits) == 1:
+            (hit_scene, hit_dist), = hits.items()
+        else:
+            # ノードが重なっている場合は、最も手前に描かれている（リストの後ろにある）ノードを優先する
+            hit_scene = next(scene for scene in reversed(self.scenes) if scene in hits)
+            hit_dist = hits[hit_scene]
+        return hit_scene.id, hit_dist >= DEFAULT_NODE_RADIUS * 0.55
+
+    def _node_hit(self, scene: Scene, cx: float, cy: float, radius: float) -> Tuple[Optional[str], bool]:
+        """座標がノードの判定範囲内ならノードIDとエッジ付近かどうかを返す"""
+        sx, sy = self._world_to_screen(scene.x, scene.y)
+        dist = math.hypot(cx - sx, cy - sy)
+        if dist <= radius * 1.2:
+            return scene.id, dist >= radius * 0.55
         return None, False
 
     def select_scene(self, scene: Optional[Scene]):
@@ -1272,9 +1731,16 @@ class NovelGameEditor:
             return
             
         self._save_current_scene_data()
+        previous = self.selected_scene
         self.selected_scene = scene
         self._update_editor_ui_state()
-        self._redraw_canvas()
+        
+        # キャンバス全体は描き直さず、選択が変わった2つのノードだけを更新する
+        if previous is not None and previous.id in self._scene_by_id:
+            self._set_node_selected(previous, False)
+        if scene is not None:
+            self._set_node_selected(scene, True)
+        self._update_status_bar()
 
     def _update_editor_ui_state(self):
         """エディタUIの状態を更新"""
@@ -1293,23 +1759,55 @@ class NovelGameEditor:
             self.scene_content_text.insert("1.0", self.selected_scene.content)
             self.scene_content_text.text.edit_modified(False)
             self._is_loading = False
+        self._content_dirty = False
             
         self.add_branch_btn.config(state=state)
         self._update_branch_list()
         self._update_text_info()
 
     def _update_branch_list(self):
-        """分岐リストを更新"""
-        self.branch_tree.delete(*self.branch_tree.get_children())
-        
-        if self.selected_scene:
-            scene_map = {s.id: s.name for s in self.scenes}
+        """分岐リストを更新（既存の行は値だけを書き換える）"""
+        tree = self.branch_tree
+        rows = self._branch_row_values
+        row_branches = self._branch_row_branches
+        if self._branch_list_scene is not self.selected_scene:
+            # 別のシーンに切り替わった時だけ全行を作り直す
+            tree.delete(*tree.get_children())
+            rows.clear()
+            row_branches.clear()
+            self._branch_list_scene = self.selected_scene
+            
+        row_count = len(rows)
+        branches = self.selected_scene.branches if self.selected_scene else []
+        selection = set(tree.selection())
+        deselect = []
+        
+        for i, branch in enumerate(branches):
+            target_scene = self._scene_by_id.get(branch.target)
+            target_name = target_scene.name if target_scene else "不明なシーン"
+            values = (branch.text, target_name, branch.condition)
+            if i >= row_count:
+                tree.insert("", tk.END, iid=str(i), values=values)
+                rows.append(values)
+                row_branches.append(branch)
+                continue
+            if row_branches[i] is not branch:
+                # 行に表示する分岐が入れ替わった場合は、別の分岐を選択したままにしない
+                row_branches[i] = branch
+                if str(i) in selection:
+                    deselect.append(str(i))
+            if rows[i] != values:
+                # 内容が変わった行だけを書き換える
+                tree.item(str(i), values=values)
+                rows[i] = values
+                
+        if row_count > len(branches):
+            tree.delete(*(str(i) for i in range(len(branches), row_count)))
+            del rows[len(branches):]
+            del row_branches[len(branches):]
             
-            for i, branch in enumerate(self.selected_scene.branches):
-                target_name = scene_map.get(branch["target"], "不明なシーン")
-                self.branch_tree.insert(
-                    "", tk.END, iid=str(i),
-                    values=(branch["text"], target_name, branch["condition"]))
+        if deselect:
+            tree.selection_remove(deselect)
                     
         self._update_branch_buttons_state()
 
@@ -1317,7 +1815,10 @@ class NovelGameEditor:
         """分岐ボタンの状態を更新"""
         is_branch_selected = bool(self.branch_tree.selection())
         state = tk.NORMAL if self.selected_scene and is_branch_selected else tk.DISABLED
-        
+        if state == self._branch_buttons_state:
+            return
+            
+        self._branch_buttons_state = state
         self.edit_branch_btn.config(state=state)
         self.delete_branch_btn.config(state=state)
 
@@ -1337,23 +1838,24 @@ class NovelGameEditor:
             self.scene_content_text.text.edit_modified(False)
             return
 
-        if not self._is_loading:
+        if not self._is_loading and self.scene_content_text.text.edit_modified():
+            self._content_dirty = True
             self._mark_dirty()
 
-        content = self.scene_content_text.get("1.0", "end-1c")
-        char_count = len(content)
-        line_count = content.count("\n") + 1
+        # 本文を文字列として取り出さず、Tk側で文字数と改行数を数える
+        char_count, newline_count = self.scene_content_text.text.count("1.0", "end-1c", "chars", "lines")
+        line_count = newline_count + 1
         
         self.text_info_label.config(text=f"文字数: {char_count} | 行数: {line_count}")
         self.scene_content_text.text.edit_modified(False)
 
     def _save_current_scene_data(self):
         """現在のシーンデータを保存"""
-        if not self.selected_scene:
-            return
-            
-        self.selected_scene.name = self.scene_name_entry.get()
-        self.selected_scene.content = self.scene_content_text.get("1.0", tk.END).strip()
+        # 遅延中の反映は取り消し、同じ処理をここで1回だけ行う
+        # （本文は編集された場合のみ取り出し、名前が変わった場合はノードのラベルも更新される）
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._do_scene_data_save()
 
     def _mark_dirty(self, dirty=True):
         """変更状態をマーク"""
@@ -1379,97 +1881,220 @@ class NovelGameEditor:
         self.canvas.tag_raise("selected")
         self._update_status_bar()
 
+    def _request_restyle(self):
+        """ズーム率に応じた線幅・フォントの更新をアイドル時に1回だけ行うよう予約"""
+        if not self._restyle_pending:
+            self._restyle_pending = True
+            self.root.after_idle(self._apply_zoom_style)
+
+    def _apply_zoom_style(self):
+        """描画済みのアイテムの線幅とフォントを現在のズーム率に合わせる（座標は変更しない）"""
+        self._restyle_pending = False
+        itemconfig = self.canvas.itemconfig
+        for is_selected, selection_tag in ((False, "!selected"), (True, "selected")):
+            oval_style, label_style = self._node_style(is_selected)
+            itemconfig(f"node_oval&&{selection_tag}", width=oval_style["width"])
+            itemconfig(f"node_label&&{selection_tag}", font=label_style["font"])
+            
+        line_width, _, font, cond_font = self._branch_style()
+        itemconfig("branch_line", width=line_width)
+        itemconfig("branch_label", font=font)
+        itemconfig("branch_cond", font=cond_font)
+
+    def _redraw_branches(self):
+        """分岐だけを描き直す（ノードはそのまま）"""
+        self.canvas.delete("branch")
+        self._draw_branches()
+        self.canvas.tag_lower("branch")
+
     def _draw_nodes(self):
         """ノードを描画"""
+        # キャンバスアイテムID -> シーン（クリック判定でタグを解析しないため）
+        self._item_to_scene = {}
+        
+        # 描画オプションはズーム率と選択状態だけで決まるので、全ノードで使い回す
+        styles = (self._node_style(False), self._node_style(True))
         for scene in self.scenes:
-            sx, sy = self._world_to_screen(scene.x, scene.y)
-            radius = DEFAULT_NODE_RADIUS * self.scale
-            
-            is_selected = self.selected_scene and self.selected_scene.id == scene.id
-            common_tag = f"node_{scene.id}"
-            tags = ("node", common_tag)
-            
-            if is_selected:
-                tags += ("selected",)
-                
-            fill_color = "#4E6A85" if is_selected else "#6C757D"
-            outline_color = "#87CEFA" if is_selected else "#ADB5BD"
-            outline_width = 3 * self.scale if is_selected else 1.5 * self.scale
-            
-            text_fill = "#FFFF80" if is_selected else "white"
-            font_style = "bold" if is_selected else "normal"
-            font_size = max(8, int(10 * self.scale))
-            font = ("Arial", font_size, font_style)
-            
-            self.canvas.create_oval(
-                sx - radius, sy - radius,
-                sx + radius, sy + radius,
-                fill=fill_color,
-                outline=outline_color,
-                width=outline_width,
-                tags=tags
-            )
+            self._draw_node(scene, styles)
+
+    def _draw_node(self, scene: Scene, styles: Optional[Tuple[Tuple[Dict[str, Any], Dict[str, Any]], ...]] = None):
+        """ノードを1つ描画（styles は非選択時・選択時の描画オプション）"""
+        sx, sy = self._world_to_screen(scene.x, scene.y)
+        radius = DEFAULT_NODE_RADIUS * self.scale
+        
+        is_selected = self.selected_scene is scene
+        common_tag = f"node_{scene.id}"
+        tags = ("node", common_tag)
+        
+        if is_selected:
+            tags += ("selected",)
             
-            self.canvas.create_text(
-                sx, sy,
-                text=scene.name,
-                fill=text_fill,
-                font=font,
-                tags=tags
+        oval_style, label_style = styles[is_selected] if styles else self._node_style(is_selected)
+        
+        oval_id = self.canvas.create_oval(
+            sx - radius, sy - radius,
+            sx + radius, sy + radius,
+            tags=tags + ("node_oval",),
+            **oval_style
+        )
+        
+        text_id = self.canvas.create_text(
+            sx, sy,
+            text=scene.name,
+            tags=tags + ("node_label",),
+            **label_style
+        )
+        self._item_to_scene[oval_id] = scene
+        self._item_to_scene[text_id] = scene
+
+    def _node_style(self, is_selected: bool) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """ノードの円とラベルの描画オプションを返す"""
+        font_size = max(8, int(10 * self.scale))
+        if is_selected:
+            return (
+                {"fill": "#4E6A85", "outline": "#87CEFA", "width": 3 * self.scale},
+                {"fill": "#FFFF80", "font": ("Arial", font_size, "bold")}
             )
+        return (
+            {"fill": "#6C757D", "outline": "#ADB5BD", "width": 1.5 * self.scale},
+            {"fill": "white", "font": ("Arial", font_size, "normal")}
+        )
+
+    def _set_node_selected(self, scene: Scene, is_selected: bool):
+        """既存ノードの選択表示だけを切り替える"""
+        common_tag = f"node_{scene.id}"
+        oval_style, label_style = self._node_style(is_selected)
+        self.canvas.itemconfig(f"{common_tag}&&node_oval", **oval_style)
+        self.canvas.itemconfig(f"{common_tag}&&node_label", **label_style)
+        
+        if is_selected:
+            self.canvas.addtag_withtag("selected", common_tag)
+            self.canvas.tag_raise(common_tag)
+        else:
+            self.canvas.dtag(common_tag, "selected")
 
     def _draw_branches(self):
         """分岐を描画"""
-        scene_map = {s.id: s for s in self.scenes}
+        scene_map = self._scene_by_id
+        # シーンID -> 接続している分岐のキャンバスアイテム（ドラッグ中の部分更新用）
+        self._incident_branch_items = incident_items = {}
+        self._branch_label_items = label_items = {}
+        
+        # ズーム率にのみ依存する値はループの外で一度だけ計算する
+        line_width, label_offset, font, cond_font = self._branch_style()
+        create_line = self.canvas.create_line
+        create_text = self.canvas.create_text
+        geometry_of = self._branch_geometry
         
         for scene in self.scenes:
-            for branch in scene.branches:
-                target_scene = scene_map.get(branch["target"])
+            # 同じシーンへの分岐が複数ある場合は線の位置を1回だけ計算する
+            geometry_by_target = {}
+            for index, branch in enumerate(scene.branches):
+                target_scene = scene_map.get(branch.target)
                 if not target_scene:
                     continue
                     
-                start_x, start_y, end_x, end_y = scene.x, scene.y, target_scene.x, target_scene.y
-                dx, dy, dist = end_x - start_x, end_y - start_y, math.hypot(end_x - start_x, end_y - start_y)
-                
-                if dist == 0:
+                if target_scene.id in geometry_by_target:
+                    geometry = geometry_by_target[target_scene.id]
+                else:
+                    geometry = geometry_by_target[target_scene.id] = geometry_of(scene, target_scene)
+                if geometry is None:
                     continue
                     
-                start_offset_x = start_x + (dx / dist) * DEFAULT_NODE_RADIUS
-                start_offset_y = start_y + (dy / dist) * DEFAULT_NODE_RADIUS
-                end_offset_x = end_x - (dx / dist) * DEFAULT_NODE_RADIUS
-                end_offset_y = end_y - (dy / dist) * DEFAULT_NODE_RADIUS
-                
-                s_start_x, s_start_y = self._world_to_screen(start_offset_x, start_offset_y)
-                s_end_x, s_end_y = self._world_to_screen(end_offset_x, end_offset_y)
+                s_start_x, s_start_y, s_end_x, s_end_y, mid_x, mid_y = geometry
                 
-                self.canvas.create_line(
+                line_id = create_line(
                     s_start_x, s_start_y,
                     s_end_x, s_end_y,
                     fill="#999999",
-                    width=1.5 * self.scale,
-                    arrow=tk.LAST
+                    width=line_width,
+                    arrow=tk.LAST,
+                    tags=("branch", "branch_line")
                 )
                 
-                mid_x, mid_y = (s_start_x + s_end_x) / 2, (s_start_y + s_end_y) / 2
-                font_size = max(7, int(9 * self.scale))
-                cond_font_size = max(6, int(8 * self.scale))
-                font = ("Arial", font_size)
-                cond_font = ("Arial", cond_font_size, "italic")
-                
-                self.canvas.create_text(
-                    mid_x, mid_y - (6 * self.scale),
-                    text=branch["text"],
+                text_id = create_text(
+                    mid_x, mid_y - label_offset,
+                    text=branch.text,
                     fill="#CCCCCC",
-                    font=font
+                    font=font,
+                    tags=("branch", "branch_label")
                 )
                 
-                if branch["condition"]:
-                    self.canvas.create_text(
-                        mid_x, mid_y + (6 * self.scale),
-                        text=f"[{branch['condition']}]",
-                        fill="#AAAAAA",
-                        font=cond_font
-                    )
+                # 条件ラベルは常に作成し、条件が無い間は非表示にしておく（編集時に作り直さないため）
+                cond_id = create_text(
+                    mid_x, mid_y + label_offset,
+                    text=f"[{branch.condition}]" if branch.condition else "",
+                    fill="#AAAAAA",
+                    font=cond_font,
+                    state=tk.NORMAL if branch.condition else tk.HIDDEN,
+                    tags=("branch", "branch_cond")
+                )
+                    
+                label_items[(scene.id, index)] = (text_id, cond_id)
+                items = (scene, target_scene, line_id, text_id, cond_id)
+                incident_items.setdefault(scene.id, []).append(items)
+                incident_items.setdefault(target_scene.id, []).append(items)
+
+    def _branch_style(self) -> Tuple[float, float, Tuple[Any, ...], Tuple[Any, ...]]:
+        """分岐線の幅、ラベルの線からの距離、ラベルと条件のフォントを返す"""
+        return (
+            1.5 * self.scale,
+            6 * self.scale,
+            ("Arial", max(7, int(9 * self.scale))),
+            ("Arial", max(6, int(8 * self.scale)), "italic")
+        )
+
+    def _branch_geometry(self, source: Scene, target: Scene) -> Optional[Tuple[float, float, float, float, float, float]]:
+        """分岐線の始点・終点・中点をスクリーン座標で返す（ノードが重なっている場合はNone）"""
+        dx, dy = target.x - source.x, target.y - source.y
+        dist = math.hypot(dx, dy)
+        if dist == 0:
+            return None
+            
+        ratio = DEFAULT_NODE_RADIUS / dist
+        offset_x, offset_y = dx * ratio, dy * ratio
+        scale, view_x, view_y = self.scale, self.view_offset_x, self.view_offset_y
+        s_start_x = (source.x + offset_x + view_x) * scale
+        s_start_y = (source.y + offset_y + view_y) * scale
+        s_end_x = (target.x - offset_x + view_x) * scale
+        s_end_y = (target.y - offset_y + view_y) * scale
+        return s_start_x, s_start_y, s_end_x, s_end_y, (s_start_x + s_end_x) / 2, (s_start_y + s_end_y) / 2
+
+    def _update_branch_items_for(self, scene_id: str):
+        """指定シーンに接続している分岐だけを現在の座標に合わせて移動"""
+        label_offset = self._branch_style()[1]
+        coords = self.canvas.coords
+        geometry_of = self._branch_geometry
+        geometry_by_pair = {}
+        
+        for source, target, line_id, text_id, cond_id in self._incident_branch_items.get(scene_id, ()):
+            pair = (source.id, target.id)
+            if pair in geometry_by_pair:
+                geometry = geometry_by_pair[pair]
+            else:
+                geometry = geometry_by_pair[pair] = geometry_of(source, target)
+            if geometry is None:
+                continue
+                
+            s_start_x, s_start_y, s_end_x, s_end_y, mid_x, mid_y = geometry
+            coords(line_id, s_start_x, s_start_y, s_end_x, s_end_y)
+            coords(text_id, mid_x, mid_y - label_offset)
+            coords(cond_id, mid_x, mid_y + label_offset)
+
+    def _update_branch_labels(self, scene: Scene, index: int) -> bool:
+        """描画済みの分岐のテキストと条件だけを書き換える（該当するアイテムが無ければFalse）"""
+        items = self._branch_label_items.get((scene.id, index))
+        if items is None:
+            return False
+            
+        text_id, cond_id = items
+        branch = scene.branches[index]
+        self.canvas.itemconfig(text_id, text=branch.text)
+        if branch.condition:
+            self.canvas.itemconfig(cond_id, text=f"[{branch.condition}]", state=tk.NORMAL)
+        else:
+            self.canvas.itemconfig(cond_id, state=tk.HIDDEN)
+        return True
 
     def _check_dirty_and_proceed(self) -> bool:
         """変更があるか確認し、処理を続行するかどうかを返す"""
@@ -1482,7 +2107,7 @@ class NovelGameEditor:
         )
         
         if answer is True:
-            return self.save_project()
+            return self.save_project() and self._wait_for_save()
         elif answer is False:
             return True
         else:
@@ -1490,13 +2115,14 @@ class NovelGameEditor:
 
     def _on_closing(self):
         """ウィンドウ閉じる時の処理"""
-        if self._check_dirty_and_proceed():
+        # 書き込み中のファイルが途中で切れないよう、保存の完了を待ってから終了する
+        if self._check_dirty_and_proceed() and self._wait_for_save():
             self.root.destroy()
 
-    def new_project(self, event=None, startup=False):
+    def new_project(self, event=None, startup=False) -> bool:
         """新規プロジェクトを作成"""
         if not startup and not self._check_dirty_and_proceed():
-            return
+            return False
             
         self.current_project_path = None
         self.project_data = {"scenes": []}
@@ -1507,6 +2133,7 @@ class NovelGameEditor:
             
         self.scenes = []
         self.project_data["scenes"] = self.scenes
+        self._rebuild_scene_index()
         self.selected_scene = None
         
         # ビュー状態のリセット
@@ -1517,24 +2144,25 @@ class NovelGameEditor:
         self._mark_dirty(False)
         self._update_editor_ui_state()
         self._redraw_canvas()
+        return True
 
-    def open_project(self, event=None, path_to_open: Optional[Path] = None):
-        """プロジェクトを開く"""
+    def open_project(self, event=None, path_to_open: Optional[Path] = None) -> bool:
+        """プロジェクトを開く（読み込んだ場合のみTrueを返す）"""
         if not self._check_dirty_and_proceed():
-            return
+            return False
             
         path_str = str(path_to_open) if path_to_open else filedialog.askopenfilename(
-            filetypes=[("ノベルプロジェクト", "*.ngp")]
+            filetypes=[("ノベルプロジェクト", "*.ngp *" + COMPRESSED_PROJECT_SUFFIX)] + PROJECT_FILETYPES
         )
         
         if not path_str:
-            return
+            return False
             
         try:
             path = Path(path_str)
             
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            self._update_status_bar(f"プロジェクト '{path.name}' を読み込み中...")
+            data = self._read_project_file(path)
                 
             scenes_data = data.get("scenes", [])
             if not isinstance(scenes_data, list):
@@ -1548,6 +2176,7 @@ class NovelGameEditor:
                 
             self.scenes = [Scene.from_dict(d) for d in scenes_data]
             self.project_data["scenes"] = self.scenes
+            self._rebuild_scene_index()
             
             self.current_project_path = path
             self.selected_scene = None
@@ -1562,9 +2191,32 @@ class NovelGameEditor:
             self.config_manager.add_recent_file(path)
             self._update_recent_files_menu()
             self._update_status_bar(f"プロジェクト '{path.name}' を開きました。")
+            return True
             
         except Exception as e:
             messagebox.showerror("エラー", f"プロジェクトの読み込みに失敗しました:\n{e}")
+            return False
+
+    def _read_project_file(self, path: Path) -> Any:
+        """プロジェクトファイルの読み込みとデコードをワーカースレッドで行い、結果を返す"""
+        result: Dict[str, Any] = {}
+        
+        def worker():
+            try:
+                result["data"] = decode_project_data(path.read_bytes())
+            except Exception as e:
+                result["error"] = e
+                
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        while thread.is_alive():
+            # 入力イベントは処理せず（操作の再入を防ぐ）、ステータス表示などのアイドル処理だけを進める
+            self.root.update_idletasks()
+            thread.join(LOAD_POLL_INTERVAL_MS / 1000)
+            
+        if "error" in result:
+            raise result["error"]
+        return result["data"]
 
     def save_project(self, event=None) -> bool:
         """プロジェクトを保存"""
@@ -1577,7 +2229,7 @@ class NovelGameEditor:
         """名前を付けてプロジェクトを保存"""
         path_str = filedialog.asksaveasfilename(
             defaultextension=".ngp",
-            filetypes=[("ノベルプロジェクト", "*.ngp")]
+            filetypes=PROJECT_FILETYPES
         )
         
         if not path_str:
@@ -1590,36 +2242,157 @@ class NovelGameEditor:
 
         return self._save_to_file(path)
 
-    def _save_to_file(self, path: Path, update_dirty_flag: bool = True) -> bool:
-        """ファイルに保存"""
+    def _save_to_file(self, path: Path, update_dirty_flag: bool = True,
+                      on_done: Optional[Callable[[bool, bool], None]] = None) -> bool:
+        """
+        ファイルに保存（エンコードと書き込みはバックグラウンドスレッドで行う）。
+        戻り値は保存を開始できたかどうか。書き込みの結果はon_done(成功したか, 内容が同じため書き込みを省略したか)で通知する。
+        """
         self._save_current_scene_data()
         data_to_save = {}
         
         # プラグイン用データを含む全データを保存
+        # ワーカースレッドでエンコードする間にメインスレッドで要素が追加・削除されないよう、最上位のリストと辞書だけ複製する。
+        # 入れ子の値は複製しないため、プラグインは中身を直接書き換えず新しい値に置き換えること（register_data_key参照）
         for key in self.pluggable_data_keys:
             if key in self.project_data:
-                data_to_save[key] = self.project_data[key]
+                value = self.project_data[key]
+                if isinstance(value, list):
+                    value = list(value)
+                elif isinstance(value, dict):
+                    value = dict(value)
+                data_to_save[key] = value
                 
-        data_to_save["scenes"] = [s.to_dict() for s in self.scenes]
+        # Scene.to_dictは毎回新しい辞書を返し、分岐リストのキャッシュは変更されず置き換えられるだけなので、
+        # この時点のスナップショットとしてそのまま別スレッドに渡せる
+        data_to_save["scenes"] = list(map(Scene.to_dict, self.scenes))
+        compress = path.suffix.lower() == COMPRESSED_PROJECT_SUFFIX
+
+        # 書き込みは順番に行うため、前回の保存が残っていれば先に完了させる
+        self._wait_for_save()
+        
+        self._save_job = {"path": path, "update_dirty_flag": update_dirty_flag,
+                          "compress": compress,
+                          "compact": compress or self.config_manager.compact_project_json,
+                          "last_saved": self._last_saved, "unchanged": False, "error": None,
+                          # バックアップ（ダーティフラグを変えない保存）は前回と同じ内容なら書き込まない
+                          "skip_digest": None if update_dirty_flag else self._last_backup_digest,
+                          "on_done": on_done}
+        self._save_thread = threading.Thread(
+            target=self._write_project_file,
+            args=(self._save_job, data_to_save),
+            daemon=True
+        )
+        self._save_thread.start()
         
+        if update_dirty_flag:
+            self._mark_dirty(False)
+            self._update_status_bar(f"プロジェクトを '{path.name}' に保存中...")
+            
+        self.root.after(SAVE_POLL_INTERVAL_MS, self._poll_save_done)
+        return True
+
+    @staticmethod
+    def _write_project_file(job: Dict[str, Any], data: Dict[str, Any]):
+        """保存データをエンコードして書き込む（ワーカースレッドで実行）"""
+        path = job["path"]
+        # 一時ファイルに書き切ってから置き換え、書き込み途中で失敗しても元のファイルを壊さない
+        tmp_path = path.with_name(path.name + ".tmp")
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data_to_save, f, ensure_ascii=False, indent=2)
-                
-            if update_dirty_flag:
-                self._mark_dirty(False)
-                self.config_manager.add_recent_file(path)
-                self._update_recent_files_menu()
-                self._update_status_bar(f"プロジェクトを '{path.name}' に保存しました。")
+            payload = encode_project_data(data, compact=job["compact"])
+            
+            # 前回書き込んだ内容から何も変わっていなければファイルは書き直さない
+            job["digest"] = digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == job["skip_digest"] or NovelGameEditor._is_saved_unchanged(job["last_saved"], path, digest):
+                job["unchanged"] = True
+                return
                 
+            if job.get("compress"):
+                payload = gzip.compress(payload, compresslevel=PROJECT_GZIP_LEVEL)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            job["mtime_ns"] = os.stat(path).st_mtime_ns
+        except Exception as e:
+            job["error"] = e
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _poll_save_done(self):
+        """バックグラウンド保存の完了を確認"""
+        if self._save_thread is None:
+            return
+            
+        if self._save_thread.is_alive():
+            self.root.after(SAVE_POLL_INTERVAL_MS, self._poll_save_done)
+        else:
+            self._finish_save()
+
+    def _wait_for_save(self) -> bool:
+        """実行中の保存が終わるまで待ち、成功したかどうかを返す"""
+        if self._save_thread is None:
             return True
             
-        except Exception as e:
-            if update_dirty_flag:
-                messagebox.showerror("エラー", f"保存に失敗しました:\n{e}")
-            else:
-                print(f"バックアップ保存失敗: {e}")
+        self._save_thread.join()
+        return self._finish_save()
+
+    def _finish_save(self) -> bool:
+        """保存完了後の処理"""
+        job = self._save_job
+        self._save_thread = None
+        self._save_job = None
+        
+        on_done = job["on_done"]
+        if job["error"] is not None:
+            self._report_save_error(job["error"], job["update_dirty_flag"])
+            if job["update_dirty_flag"]:
+                self._mark_dirty()
+            if on_done:
+                on_done(False, False)
             return False
+            
+        path = job["path"]
+        if not job["update_dirty_flag"]:
+            self._last_backup_digest = job["digest"]
+        if job["unchanged"]:
+            if job["update_dirty_flag"]:
+                self._update_status_bar(f"'{path.name}' は最新の状態です。")
+            if on_done:
+                on_done(True, True)
+            return True
+            
+        self._last_saved = (path, job["digest"], job["mtime_ns"])
+        if job["update_dirty_flag"]:
+            self.config_manager.add_recent_file(path)
+            self._update_recent_files_menu()
+            self._update_status_bar(f"プロジェクトを '{path.name}' に保存しました。")
+        if on_done:
+            on_done(True, False)
+            
+        return True
+
+    @staticmethod
+    def _is_saved_unchanged(last_saved: Optional[Tuple[Path, bytes, int]], path: Path, digest: bytes) -> bool:
+        """同じ内容を書き込んだファイルが、その後変更されずに残っているか"""
+        if last_saved is None:
+            return False
+            
+        saved_path, saved_digest, saved_mtime_ns = last_saved
+        if saved_path != path or saved_digest != digest:
+            return False
+        try:
+            return path.stat().st_mtime_ns == saved_mtime_ns
+        except OSError:
+            return False
+
+    def _report_save_error(self, error: Exception, update_dirty_flag: bool):
+        """保存エラーを通知"""
+        if update_dirty_flag:
+            messagebox.showerror("エラー", f"保存に失敗しました:\n{error}")
+        else:
+            print(f"バックアップ保存失敗: {error}")
 
     def _update_recent_files_menu(self):
         """最近使ったファイルメニューを更新"""
@@ -1644,27 +2417,14 @@ class NovelGameEditor:
             )
 
     def _update_menu_accelerators(self):
-        """メニューのアクセラレータを更新"""
-        self.file_menu.entryconfig(
-            "新規",
-            accelerator=self.config_manager.get_shortcut_display('new_project')
-        )
-        self.file_menu.entryconfig(
-            "開く...",
-            accelerator=self.config_manager.get_shortcut_display('open_project')
-        )
-        self.file_menu.entryconfig(
-            "保存",
-            accelerator=self.config_manager.get_shortcut_display('save_project')
-        )
-        self.file_menu.entryconfig(
-            "名前を付けて保存...",
-            accelerator=self.config_manager.get_shortcut_display('save_project_as')
-        )
-        self.edit_menu.entryconfig(
-            "シーンを追加",
-            accelerator=self.config_manager.get_shortcut_display('add_scene')
-        )
+        """メニューのアクセラレータを更新（表示が変わった項目だけを書き換える）"""
+        menus = {"file": self.file_menu, "edit": self.edit_menu}
+        applied = self._menu_accelerators
+        for menu_name, label, action in MENU_ACCELERATOR_ITEMS:
+            display = self.config_manager.get_shortcut_display(action)
+            if applied.get(action) != display:
+                menus[menu_name].entryconfig(label, accelerator=display)
+                applied[action] = display
 
     def add_scene(self, event=None, return_scene=False, at_canvas_pos=None):
         """新しいシーンを追加"""
@@ -1678,10 +2438,14 @@ class NovelGameEditor:
             
         new_scene = Scene(name="新しいシーン", x=wx, y=wy)
         self.scenes.append(new_scene)
+        self._scene_by_id[new_scene.id] = new_scene
+        self._grid_insert(new_scene)
         self.select_scene(new_scene)
         
+        # 新しいシーンには分岐が無いので、そのノードだけを描き足す
+        self._draw_node(new_scene)
         self._mark_dirty()
-        self._redraw_canvas()
+        self._update_status_bar()
         
         if return_scene:
             return new_scene
@@ -1697,16 +2461,28 @@ class NovelGameEditor:
         ):
             return
             
-        sid = self.selected_scene.id
-        self.scenes = [s for s in self.scenes if s.id != sid]
+        deleted = self.selected_scene
+        sid = deleted.id
+        self.scenes.remove(deleted)
+        self._scene_by_id.pop(sid, None)
+        self._grid_remove(deleted, deleted.x, deleted.y)
+        self._track_branches(deleted, (b.target for b in deleted.branches), -1)
         
-        # このシーンをターゲットとする分岐を全て削除
-        for scene in self.scenes:
-            scene.branches = [b for b in scene.branches if b.get("target") != sid]
+        # このシーンをターゲットとする分岐を全て削除（逆引き索引で該当シーンだけを処理）
+        for source_id in self._incoming.pop(sid, {}):
+            source = self._scene_by_id.get(source_id)
+            if source:
+                source.remove_branches_to(sid)
             
         self.select_scene(None)
         self._mark_dirty()
-        self._redraw_canvas()
+        
+        # 削除したノードのアイテムだけを消し、分岐を描き直す（他のノードは作り直さない）
+        node_tag = f"node_{sid}"
+        for item in self.canvas.find_withtag(node_tag):
+            self._item_to_scene.pop(item, None)
+        self.canvas.delete(node_tag)
+        self._redraw_branches()
 
     def add_branch(self, event=None):
         """分岐を追加"""
@@ -1723,9 +2499,10 @@ class NovelGameEditor:
         
         if dialog.result:
             self.selected_scene.add_branch(**dialog.result)
+            self._track_branches(self.selected_scene, (dialog.result["target"],), 1)
             self._mark_dirty()
             self._update_branch_list()
-            self._redraw_canvas()
+            self._redraw_branches()
 
     def edit_branch(self, event=None):
         """分岐を編集"""
@@ -1745,16 +2522,22 @@ class NovelGameEditor:
             self.scenes,
             self.selected_scene,
             app=self,
-            initial_text=branch["text"],
-            initial_target_id=branch["target"],
-            initial_condition=branch["condition"]
+            initial_text=branch.text,
+            initial_target_id=branch.target,
+            initial_condition=branch.condition
         )
         
         if dialog.result:
-            self.selected_scene.branches[branch_index] = dialog.result
+            # 分岐に付いている追加のキーは編集後も引き継ぐ
+            self.selected_scene.set_branch(branch_index, Branch(**dialog.result, extra=branch.extra))
+            self._track_branches(self.selected_scene, (branch.target,), -1)
+            self._track_branches(self.selected_scene, (dialog.result["target"],), 1)
             self._mark_dirty()
             self._update_branch_list()
-            self._redraw_canvas()
+            # 遷移先が同じなら線はそのままで、ラベルだけを書き換える
+            if branch.target != dialog.result["target"] or \
+                    not self._update_branch_labels(self.selected_scene, branch_index):
+                self._redraw_branches()
 
     def delete_branch(self, event=None):
         """分岐を削除"""
@@ -1764,17 +2547,17 @@ class NovelGameEditor:
         if not messagebox.askyesno("確認", "選択した分岐を削除しますか？"):
             return
             
-        indices_to_delete = sorted(
-            [self.branch_tree.index(iid) for iid in self.branch_tree.selection()],
-            reverse=True
-        )
-        
-        for index in indices_to_delete:
-            del self.selected_scene.branches[index]
+        selection = self.branch_tree.selection()
+        indices = [self.branch_tree.index(iid) for iid in selection]
+        branches = self.selected_scene.branches
+        self._track_branches(self.selected_scene, (branches[i].target for i in indices), -1)
+        self.selected_scene.remove_branches(indices)
+        # 行は番号で使い回されるため、選択を残すと後ろの分岐が繰り上がった行が選択されたままになる
+        self.branch_tree.selection_remove(selection)
             
         self._mark_dirty()
         self._update_branch_list()
-        self._redraw_canvas()
+        self._redraw_branches()
 
     def _on_delete_key_pressed(self, event):
         """Deleteキーが押された時の処理"""
@@ -1786,17 +2569,33 @@ class NovelGameEditor:
             self.delete_scene()
 
     def _on_scene_data_changed(self, event=None):
-        """シーンデータが変更された時の処理"""
+        """シーンデータが変更された時の処理（連続したイベントは1回にまとめる）"""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(SCENE_SAVE_DEBOUNCE_MS, self._do_scene_data_save)
+
+    def _do_scene_data_save(self):
+        """エディタの内容をシーンに反映"""
+        self._save_after_id = None
         if not self.selected_scene:
             return
             
-        name_changed = self.scene_name_entry.get() != self.selected_scene.name
-        content_changed = self.scene_content_text.get("1.0", tk.END).strip() != self.selected_scene.content
+        # ウィジェットの内容は一度だけ取得し、比較と反映の両方に使う
+        name = self.scene_name_entry.get()
+        name_changed = name != self.selected_scene.name
+        content_changed = False
+        if self._content_dirty:
+            content = self.scene_content_text.get("1.0", "end-1c").strip()
+            content_changed = content != self.selected_scene.content
+            self.selected_scene.content = content
+            self._content_dirty = False
         
         if name_changed or content_changed:
-            self._save_current_scene_data()
+            self.selected_scene.name = name
             if name_changed:
-                self._redraw_canvas()
+                # 名前の変更はノードのラベルだけを書き換える
+                self.canvas.itemconfig(f"node_{self.selected_scene.id}&&node_label", text=name)
+                self._update_status_bar()
             self._mark_dirty()
 
     def _on_editor_modified(self, event=None):
@@ -1827,6 +2626,7 @@ class NovelGameEditor:
             
         world_x_before, world_y_before = self._screen_to_world(x, y)
         
+        old_scale = self.scale
         self.scale *= factor
         self.scale = max(MIN_ZOOM, min(MAX_ZOOM, self.scale))
         
@@ -1835,7 +2635,14 @@ class NovelGameEditor:
         self.view_offset_x += world_x_before - world_x_after
         self.view_offset_y += world_y_before - world_y_after
         
-        self._redraw_canvas()
+        if self.scale == old_scale:
+            return
+        # (x, y) を中心とした拡大縮小なので、全アイテムの座標はTk側でまとめて変換できる
+        # 線幅とフォントはホイールで連続してズームしてもアイドル時に1回だけ更新する
+        ratio = self.scale / old_scale
+        self.canvas.scale("all", x, y, ratio, ratio)
+        self._request_restyle()
+        self._update_status_bar()
 
     def zoom_in(self, event=None):
         """ズームイン"""
@@ -1852,54 +2659,34 @@ class NovelGameEditor:
 
     def setup_shortcuts(self):
         """ショートカットキーを設定"""
-        # 既存のバインドを解除
-        for shortcut in self.bound_shortcuts:
-            self.root.unbind(shortcut)
-        self.bound_shortcuts.clear()
-
-        bindings = {
-            'new_project': self.new_project,
-            'open_project': self.open_project,
-            'save_project': self.save_project,
-            'save_project_as': self.save_project_as,
-            'add_scene': self.add_scene,
-            'add_branch': self.add_branch,
-            'zoom_in': self.zoom_in,
-            'zoom_out': self.zoom_out,
-            'reset_view': self.reset_view
-        }
-        
-        for action, command in bindings.items():
-            shortcut = self.config_manager.get_shortcut(action)
-            if not shortcut:
-                continue
+        wanted: Dict[str, str] = {}
+        for action, _ in SHORTCUT_ACTIONS:
+            tk_key = self.config_manager.get_tk_binding(action)
+            if tk_key:
+                wanted[tk_key] = action
                 
-            parts = shortcut.replace('+', '-').split('-')
-            modifiers = sorted([p.capitalize() for p in parts[:-1] if p.lower() in ('control', 'alt', 'shift')])
-            key = parts[-1].lower()
-
-            if not key:
+        # 使われなくなった、または割り当てが変わったバインドだけを解除する
+        for tk_key, action in list(self.bound_shortcuts.items()):
+            if wanted.get(tk_key) != action:
+                self.root.unbind(tk_key)
+                del self.bound_shortcuts[tk_key]
+                
+        for tk_key, action in wanted.items():
+            if tk_key in self.bound_shortcuts:
                 continue
+            self.root.bind(tk_key, partial(self._run_action, action))
+            self.bound_shortcuts[tk_key] = action
 
-            # Shift + 英字の場合: <Control-Shift-s> はShift押下時にkeysymが'S'になるため
-            # 発火しない。<Control-S> 形式（大文字）に変換して正しく動作させる
-            if 'Shift' in modifiers and len(key) == 1 and key.isalpha():
-                modifiers = [m for m in modifiers if m != 'Shift']
-                key = key.upper()
-
-            # tkinterのフォーマットに変換
-            tk_key_parts = list(modifiers)
+        self._update_menu_accelerators()
 
-            # 'plus' や 'minus' などの特殊なキー名を正しく扱う
-            key_map = {'plus': 'plus', 'minus': 'minus', 'equal': 'equal'}
-            tk_key_parts.append(key_map.get(key, key))
-            
-            tk_key = f"<{'-'.join(tk_key_parts)}>"
-            
-            self.root.bind(tk_key, lambda e, cmd=command: cmd())
-            self.bound_shortcuts.append(tk_key)  # 新しいバインドをリストに追加
+    def _on_config_reloaded(self):
+        """config.iniが外部で変更され読み直された時に、キーバインドとメニュー表示を合わせる"""
+        self.setup_shortcuts()
+        self._update_recent_files_menu()
 
-        self._update_menu_accelerators()
+    def _run_action(self, action: str, event=None):
+        """アクション名と同名のメソッドを呼び出す（プラグインによる差し替えも反映される）"""
+        getattr(self, action)()
 
     def _load_plugins(self):
         """プラグインをロード"""
@@ -1912,6 +2699,10 @@ class NovelGameEditor:
             
         for name in plugin_names:
             self.plugin_manager.load_plugin(name)
+            
+        # 起動時のプロジェクトはプラグインより先に作成されているため、登録されたデータキーを補う
+        for key, default in self.pluggable_data_keys.items():
+            self.project_data.setdefault(key, default)
 
 # --- メイン実行ブロック ---
 if __name__ == "__main__":
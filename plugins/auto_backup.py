@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
-import datetime
+import time
 import configparser
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Tuple
 
 # 型チェック時のみインポートを有効にする
 if TYPE_CHECKING:
@@ -17,20 +17,36 @@ except ImportError:
         def __init__(self, app): self.app = app
 
 class BackupSettingsDialog(tk.Toplevel):
-    """バックアップ設定用のダイアログ"""
+    """バックアップ設定用のダイアログ（一度作成したら閉じずに隠して使い回す）"""
     def __init__(self, parent, plugin: 'AutoBackupPlugin'):
         super().__init__(parent)
+        self.withdraw()
         self.plugin = plugin
         self.title("バックアップ設定")
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.hide)
         
-        self.enabled_var = tk.BooleanVar(value=self.plugin.is_enabled)
-        self.interval_var = tk.IntVar(value=self.plugin.interval_minutes)
+        self.enabled_var = tk.BooleanVar()
+        self.interval_var = tk.IntVar()
+        self._closed_var = tk.BooleanVar(value=True)
         
         self._create_widgets()
         self.resizable(False, False)
-        self.wait_window(self)
+
+    def show(self):
+        """現在の設定値を反映して表示し、閉じられるまで待つ"""
+        self.enabled_var.set(self.plugin.is_enabled)
+        self.interval_var.set(self.plugin.interval_minutes)
+        self._closed_var.set(False)
+        self.deiconify()
+        self.grab_set()
+        self.wait_variable(self._closed_var)
+
+    def hide(self):
+        """ウィジェットは破棄せずに隠す"""
+        self.grab_release()
+        self.withdraw()
+        self._closed_var.set(True)
 
     def _create_widgets(self):
         main_frame = ttk.Frame(self, padding="15")
@@ -51,18 +67,24 @@ class BackupSettingsDialog(tk.Toplevel):
         button_frame.grid(row=2, column=0, columnspan=2, pady=(15, 0))
         
         ttk.Button(button_frame, text="保存", command=self._save_settings).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="キャンセル", command=self.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="キャンセル", command=self.hide).pack(side=tk.LEFT, padx=5)
 
     def _save_settings(self):
-        self.plugin.set_enabled(self.enabled_var.get())
-        self.plugin.set_interval(self.interval_var.get())
+        # 両方の設定を反映してから、変更があった場合のみconfig.iniに1回だけ書き込む
+        changed = self.plugin.set_enabled(self.enabled_var.get(), save=False)
+        changed |= self.plugin.set_interval(self.interval_var.get(), save=False)
+        if changed:
+            self.plugin._save_config()
         messagebox.showinfo("設定完了", "バックアップ設定を保存しました。", parent=self)
-        self.destroy()
+        self.hide()
 
 class AutoBackupPlugin(IPlugin):
     def setup(self) -> None:
         print("[プラグイン: AutoBackup] セットアップを開始します。")
         self.backup_job_id: Optional[str] = None
+        self._settings_dialog: Optional[BackupSettingsDialog] = None
+        # (プロジェクトパス, ファイル名の接頭辞) — パスが変わった時だけ作り直す
+        self._backup_name_prefix: Tuple[Optional[Path], str] = (None, "")
         
         # 設定の読み込み
         self._load_config()
@@ -82,9 +104,17 @@ class AutoBackupPlugin(IPlugin):
         print("[プラグイン: AutoBackup] 終了処理を実行します。")
         self.stop_backup_timer()
         self.app.remove_plugin_menu_command("バックアップ設定...")
+        if self._settings_dialog is not None:
+            try:
+                self._settings_dialog.destroy()
+            except tk.TclError:
+                pass  # ウィンドウが既に閉じられている場合など
+            self._settings_dialog = None
     
     def _load_config(self):
         """config.iniから設定を読み込む"""
+        # 外部でconfig.iniが編集されていなければ再解析しない
+        self.app.config_manager.reload_if_changed()
         config = self.app.config_manager.config
         if not config.has_section('BACKUP'):
             config.add_section('BACKUP')
@@ -105,28 +135,38 @@ class AutoBackupPlugin(IPlugin):
         self.app.config_manager._save_config()
 
     def show_settings_dialog(self):
-        BackupSettingsDialog(self.app.root, self)
+        # 2回目以降は作成済みのダイアログを再表示する
+        dialog = self._settings_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._settings_dialog = BackupSettingsDialog(self.app.root, self)
+        dialog.show()
     
-    def set_enabled(self, enabled: bool):
+    def set_enabled(self, enabled: bool, save: bool = True) -> bool:
+        """有効/無効を切り替える（変更があった場合はTrueを返す）"""
         if self.is_enabled == enabled:
-            return
+            return False
         self.is_enabled = enabled
-        self._save_config()
+        if save:
+            self._save_config()
         if self.is_enabled:
             self.start_backup_timer()
         else:
             self.stop_backup_timer()
+        return True
             
-    def set_interval(self, minutes: int):
+    def set_interval(self, minutes: int, save: bool = True) -> bool:
+        """バックアップ間隔を変更する（変更があった場合はTrueを返す）"""
         minutes = max(1, min(minutes, 60)) # 1分から60分の範囲に制限
         if self.interval_minutes == minutes:
-            return
+            return False
         self.interval_minutes = minutes
-        self._save_config()
+        if save:
+            self._save_config()
         # タイマーが動いていれば、新しい間隔で再スケジュール
         if self.is_enabled:
             self.stop_backup_timer()
             self.start_backup_timer()
+        return True
 
     def start_backup_timer(self):
         if self.backup_job_id:
@@ -142,6 +182,28 @@ class AutoBackupPlugin(IPlugin):
             self.backup_job_id = None
             print("[プラグイン: AutoBackup] バックアップタイマーを停止しました。")
 
+    def _get_backup_name_prefix(self) -> str:
+        """バックアップファイル名の接頭辞（プロジェクト名_backup_）を返す"""
+        project_path = self.app.current_project_path
+        cached_path, prefix = self._backup_name_prefix
+        if not prefix or cached_path != project_path:
+            # プロジェクト名はstrftimeに通さない（日本語名がロケールによって化けるのを避ける）
+            base_name = project_path.stem if project_path else "Untitled"
+            prefix = f"{base_name}_backup_"
+            self._backup_name_prefix = (project_path, prefix)
+        return prefix
+
+    def _on_backup_done(self, backup_path: Path, success: bool, unchanged: bool):
+        """バックアップの書き込みが完了（または失敗）したときの処理"""
+        if not success:
+            print("[プラグイン: AutoBackup] バックアップに失敗しました。")
+        elif unchanged:
+            self.app._update_status_bar("前回のバックアップから内容が変わっていないため、書き込みを省略しました。")
+            print("[プラグイン: AutoBackup] 前回のバックアップと同じ内容のため、書き込みを省略しました。")
+        else:
+            self.app._update_status_bar(f"プロジェクトをバックアップしました: {backup_path.name}")
+            print(f"[プラグイン: AutoBackup] バックアップ成功: {backup_path}")
+
     def perform_backup(self):
         """バックアップ処理を実行し、次のタイマーをスケジュールする"""
         if not self.is_enabled:
@@ -154,26 +216,16 @@ class AutoBackupPlugin(IPlugin):
             return
         
         try:
-            # プロジェクト名を取得
-            if self.app.current_project_path:
-                base_name = self.app.current_project_path.stem
-            else:
-                base_name = "Untitled"
-            
-            # 日時情報を付加
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"{base_name}_backup_{timestamp}.ngp"
+            # 日時情報を付加（datetimeオブジェクトを作らずに整形する）
+            backup_filename = f"{self._get_backup_name_prefix()}{time.strftime('%Y%m%d_%H%M%S')}.ngp"
             backup_path = self.backup_dir / backup_filename
             
-            # メインアプリの保存ロジックを呼び出す
-            # _save_to_fileは成功時にTrueを返す
-            success = self.app._save_to_file(backup_path, update_dirty_flag=False)
-
-            if success:
-                # バックアップ成功時はダーティフラグをリセットしない
-                self.app._update_status_bar(f"プロジェクトをバックアップしました: {backup_filename}")
-                print(f"[プラグイン: AutoBackup] バックアップ成功: {backup_path}")
-            else:
+            # メインアプリの保存ロジックを呼び出す（ダーティフラグはリセットしない）
+            # 書き込みはバックグラウンドで行われるため、結果は完了時のコールバックで受け取る
+            if not self.app._save_to_file(
+                backup_path, update_dirty_flag=False,
+                on_done=lambda success, unchanged: self._on_backup_done(backup_path, success, unchanged)
+            ):
                 print("[プラグイン: AutoBackup] バックアップに失敗しました。")
 
         except Exception as e:
@@ -1,7 +1,8 @@
 import tkinter as tk
-from tkinter import ttk, colorchooser, filedialog, messagebox
+from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-import uuid
+import os
+from bisect import bisect_left
 from typing import TYPE_CHECKING, Optional, Dict, Any
 
 # 型チェック時のみインポートを有効にする（循環参照を避けるため）
@@ -21,8 +22,11 @@ except ImportError:
 
 class Character:
     """キャラクターのデータを保持するクラス"""
-    def __init__(self, name: str = "新規キャラクター", description: str = "", color: str = "#FFFFFF", image_path: str = ""):
-        self.id: str = str(uuid.uuid4())
+    __slots__ = ("id", "name", "description", "color", "image_path")
+
+    def __init__(self, name: str = "新規キャラクター", description: str = "", color: str = "#FFFFFF", image_path: str = "",
+                 id: Optional[str] = None):
+        self.id: str = id if id is not None else os.urandom(16).hex()
         self.name: str = name
         self.description: str = description
         self.color: str = color
@@ -39,22 +43,31 @@ class Character:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Character':
-        char = cls()
-        char.id = data.get("id", str(uuid.uuid4()))
-        char.name = data.get("name", "名称未設定")
-        char.description = data.get("description", "")
-        char.color = data.get("color", "#FFFFFF")
-        char.image_path = data.get("image_path", "")
-        return char
+        # IDが保存されている場合は新規IDを生成しない
+        get = data.get
+        return cls(
+            name=get("name", "名称未設定"),
+            description=get("description", ""),
+            color=get("color", "#FFFFFF"),
+            image_path=get("image_path", ""),
+            id=get("id")
+        )
 
 class CharacterManagerPlugin(IPlugin):
     """キャラクター管理機能を提供するプラグイン"""
+    _EDIT_FLUSH_DELAY_MS = 150  # 連続した編集イベントをまとめて反映するまでの待ち時間
     
     def setup(self) -> None:
         """プラグインの初期設定"""
         print("[プラグイン: CharacterManager] セットアップを開始します。")
         self.characters: Dict[str, Character] = {}
+        # 保存用の辞書表現。変更時に丸ごと差し替えるので、保存スレッドと共有しても安全
+        self._serialized_chars: Dict[str, Dict[str, Any]] = {}
         self.selected_character_id: Optional[str] = None
+        self._edit_dirty = False  # 名前・説明欄がユーザーによって編集されたか
+        self._edit_after_id = None  # 遅延中の編集反映ジョブ
+        self._ui_ready = False  # _create_uiが最後まで完了したか
+        self._tree_order: list = []  # char_treeの行順に並べた (名前, ID) のリスト
         
         # プロジェクトデータに 'characters' キーを登録
         self.app.register_data_key("characters", [])
@@ -70,8 +83,9 @@ class CharacterManagerPlugin(IPlugin):
     def teardown(self) -> None:
         """プラグインのクリーンアップ処理"""
         print("[プラグイン: CharacterManager] 終了処理を実行します。")
+        self._cancel_edit_flush()
         try:
-            if hasattr(self, 'notebook'):
+            if self._ui_ready:
                 self.notebook.forget(self.main_frame)
         except tk.TclError:
             pass # ウィンドウが既に閉じられている場合など
@@ -83,19 +97,24 @@ class CharacterManagerPlugin(IPlugin):
         original_open_project = self.app.open_project
         original_save_to_file = self.app._save_to_file
 
+        # 元のメソッドがキャンセルされた場合は、編集中のキャラクターを読み直さない
         def new_project_with_chars(*args, **kwargs):
-            original_new_project(*args, **kwargs)
+            if not original_new_project(*args, **kwargs):
+                return False
             self._load_characters_from_project()
             print("[プラグイン: CharacterManager] 新規プロジェクトでキャラクターリストを初期化しました。")
+            return True
 
         def open_project_with_chars(*args, **kwargs):
-            original_open_project(*args, **kwargs)
+            if not original_open_project(*args, **kwargs):
+                return False
             self._load_characters_from_project()
             print("[プラグイン: CharacterManager] プロジェクトからキャラクターを読み込みました。")
+            return True
             
         def save_to_file_with_chars(path: Path, *args, **kwargs) -> bool:
-            self._save_current_character_data()
-            self.app.project_data['characters'] = [char.to_dict() for char in self.characters.values()]
+            self._commit_character_edit()
+            self.app.project_data['characters'] = list(self._serialized_chars.values())
             
             # 受け取った可変長引数(*args, **kwargs)をそのまま元の関数に渡す
             return original_save_to_file(path, *args, **kwargs)
@@ -149,15 +168,17 @@ class CharacterManagerPlugin(IPlugin):
         details_frame.columnconfigure(1, weight=1)
         
         ttk.Label(details_frame, text="名前:").grid(row=0, column=0, sticky="w", padx=5, pady=3)
-        self.name_entry = ttk.Entry(details_frame)
+        # 名前欄は変数のトレースで変更を検知し、反映は_on_data_changedの遅延処理にまとめる
+        self._name_var = tk.StringVar()
+        self.name_entry = ttk.Entry(details_frame, textvariable=self._name_var)
         self.name_entry.grid(row=0, column=1, columnspan=2, sticky="ew", padx=5, pady=3)
-        self.name_entry.bind("<FocusOut>", self._on_data_changed)
-        self.name_entry.bind("<Return>", self._on_data_changed)
+        self._name_var.trace_add("write", self._on_name_written)
 
         ttk.Label(details_frame, text="説明:").grid(row=1, column=0, sticky="nw", padx=5, pady=3)
         self.desc_text = tk.Text(details_frame, height=5, wrap=tk.WORD)
         self.desc_text.grid(row=1, column=1, columnspan=2, sticky="nsew", padx=5, pady=3)
         self.desc_text.bind("<FocusOut>", self._on_data_changed)
+        self.desc_text.bind("<<Modified>>", self._on_desc_modified)
         
         ttk.Label(details_frame, text="カラー:").grid(row=2, column=0, sticky="w", padx=5, pady=3)
         self.color_swatch = tk.Label(details_frame, text="      ", bg="#FFFFFF", relief="sunken")
@@ -170,34 +191,70 @@ class CharacterManagerPlugin(IPlugin):
         self.image_path_entry.grid(row=3, column=1, sticky="ew", padx=5, pady=3)
         image_btn = ttk.Button(details_frame, text="参照...", command=self._choose_image)
         image_btn.grid(row=3, column=2, sticky="w", padx=5)
+        self._detail_buttons = (color_btn, image_btn)
         
         self._update_details_state(tk.DISABLED)
+        self._ui_ready = True
 
     def _load_characters_from_project(self):
         """
         メインアプリのプロジェクトデータからキャラクター情報を読み込み、
         プラグインの内部状態とUIを完全に更新する。
         """
-        if not hasattr(self, 'char_tree'):
+        if not self._ui_ready:
             return
 
         self.characters.clear()
+        self._serialized_chars.clear()
         char_data_list = self.app.project_data.get("characters", [])
         
         for char_data in char_data_list:
             if isinstance(char_data, dict):
                 char = Character.from_dict(char_data)
                 self.characters[char.id] = char
+                self._serialized_chars[char.id] = char.to_dict()
         
         self._update_character_list()
         self.select_character(None)
 
     def _update_character_list(self):
-        """UIのキャラクターリストを更新する"""
+        """UIのキャラクターリストを作り直す（プロジェクト読み込み時のみ）"""
         self.char_tree.delete(*self.char_tree.get_children())
-        sorted_chars = sorted(self.characters.values(), key=lambda c: c.name)
-        for char in sorted_chars:
-            self.char_tree.insert("", tk.END, iid=char.id, values=(char.name,))
+        self._tree_order = sorted((char.name, char.id) for char in self.characters.values())
+        if not self._tree_order:
+            return
+        # 行ごとにinsertを呼ぶとTclとの往復が行数分発生するため、Tclのforeachで一度に挿入する
+        # （値はTclのリストとして渡されるので、名前に空白や括弧が含まれていてもそのまま扱える）
+        rows = tuple(value for name, char_id in self._tree_order for value in (char_id, name))
+        self.char_tree.tk.call(
+            "foreach", ("iid", "name"), rows,
+            f"{self.char_tree} insert {{}} end -id $iid -values [list $name]"
+        )
+
+    def _tree_insert_character(self, char: Character):
+        """キャラクターを名前順の位置に1行だけ挿入する"""
+        key = (char.name, char.id)
+        index = bisect_left(self._tree_order, key)
+        self._tree_order.insert(index, key)
+        self.char_tree.insert("", index, iid=char.id, values=(char.name,))
+
+    def _tree_delete_character(self, char: Character):
+        """キャラクターの行だけを削除する"""
+        index = bisect_left(self._tree_order, (char.name, char.id))
+        del self._tree_order[index]
+        self.char_tree.delete(char.id)
+
+    def _tree_rename_character(self, char: Character, old_name: str):
+        """名前変更された行の表示を更新し、並び順が変わる場合のみ移動する"""
+        old_index = bisect_left(self._tree_order, (old_name, char.id))
+        del self._tree_order[old_index]
+        key = (char.name, char.id)
+        new_index = bisect_left(self._tree_order, key)
+        self._tree_order.insert(new_index, key)
+        self.char_tree.item(char.id, values=(char.name,))
+        if new_index != old_index:
+            # Treeview.move の index は移動する行自身を除いた並びで数えるため、new_indexをそのまま渡す
+            self.char_tree.move(char.id, "", new_index)
 
     def _on_character_select(self, event=None):
         """キャラクターがリストで選択されたときの処理"""
@@ -211,17 +268,19 @@ class CharacterManagerPlugin(IPlugin):
     def select_character(self, char_id: Optional[str]):
         """指定されたIDのキャラクターを選択状態にする"""
         if self.selected_character_id and self.selected_character_id != char_id:
-             self._save_current_character_data()
+            self._commit_character_edit()
 
         self.selected_character_id = char_id
         
         if char_id and char_id in self.characters:
             char = self.characters[char_id]
-            self.name_entry.delete(0, tk.END)
-            self.name_entry.insert(0, char.name)
+            # 無効状態のままでは入力欄に値を挿入できないため、先に有効化する
+            self._update_details_state(tk.NORMAL)
+            self._name_var.set(char.name)
             
             self.desc_text.delete("1.0", tk.END)
             self.desc_text.insert("1.0", char.description)
+            self.desc_text.edit_modified(False)
             
             self.color_swatch.config(bg=char.color)
             
@@ -230,12 +289,12 @@ class CharacterManagerPlugin(IPlugin):
             self.image_path_entry.insert(0, char.image_path)
             self.image_path_entry.config(state="readonly")
 
-            self._update_details_state(tk.NORMAL)
             self.delete_btn.config(state=tk.NORMAL)
         else:
             self.selected_character_id = None
-            self.name_entry.delete(0, tk.END)
+            self._name_var.set("")
             self.desc_text.delete("1.0", tk.END)
+            self.desc_text.edit_modified(False)
             self.color_swatch.config(bg="#FFFFFF")
             self.image_path_entry.config(state=tk.NORMAL)
             self.image_path_entry.delete(0, tk.END)
@@ -244,41 +303,89 @@ class CharacterManagerPlugin(IPlugin):
             self._update_details_state(tk.DISABLED)
             self.delete_btn.config(state=tk.DISABLED)
 
+        # フォームへの値の設定は編集ではないので、トレースで予約された反映も取り消す
+        self._cancel_edit_flush()
+        self._edit_dirty = False
+
     def _update_details_state(self, state: str):
         """詳細編集フォームの有効/無効を切り替える"""
         self.name_entry.config(state=state)
         self.desc_text.config(state=state)
-        for child in self.name_entry.master.winfo_children():
-            if isinstance(child, ttk.Button):
-                child.config(state=state)
+        for button in self._detail_buttons:
+            button.config(state=state)
 
-    def _save_current_character_data(self):
-        """現在選択中のキャラクターの編集内容をプラグインの内部データに保存する"""
-        if not hasattr(self, 'name_entry'):
-            return
+    def _save_current_character_data(self) -> bool:
+        """
+        現在選択中のキャラクターの編集内容をプラグインの内部データに保存する。
+        内容が実際に変わった場合のみTrueを返す。
+        """
+        if not self._ui_ready:
+            return False
             
         if not self.selected_character_id or self.selected_character_id not in self.characters:
-            return
+            return False
+            
+        if not self._edit_dirty:
+            return False
             
         char = self.characters[self.selected_character_id]
-        char.name = self.name_entry.get()
-        char.description = self.desc_text.get("1.0", tk.END).strip()
+        before = (char.name, char.description)
+        char.name = self._name_var.get()
+        char.description = self.desc_text.get("1.0", "end-1c").strip()
+        self._edit_dirty = False
+        return (char.name, char.description) != before
+
+    def _cancel_edit_flush(self):
+        """遅延中の編集反映ジョブがあれば取り消す"""
+        if self._edit_after_id:
+            self.app.root.after_cancel(self._edit_after_id)
+            self._edit_after_id = None
+
+    def _on_name_written(self, *args):
+        """名前欄の値が書き換えられたときに編集済みとして記録し、反映を予約する"""
+        self._edit_dirty = True
+        self._on_data_changed()
+
+    def _on_desc_modified(self, event=None):
+        """説明欄の変更を編集済みとして記録する"""
+        if self.desc_text.edit_modified():
+            self._edit_dirty = True
+            self.desc_text.edit_modified(False)
+
+    def _sync_serialized(self, char: Character):
+        """キャラクター1件分の保存用辞書を作り直す"""
+        self._serialized_chars[char.id] = char.to_dict()
+
+    def _commit_character_edit(self) -> bool:
+        """編集内容を内部データに反映し、変更があればリストの該当行も更新する"""
+        # 遅延中の反映は取り消し、同じ処理をここで1回だけ行う
+        self._cancel_edit_flush()
+        char = self.characters.get(self.selected_character_id) if self.selected_character_id else None
+        if char is None:
+            return False
+        old_name = char.name
+        if not self._save_current_character_data():
+            return False
+        self._sync_serialized(char)
+        self.app._mark_dirty()
+        if char.name != old_name:
+            self._tree_rename_character(char, old_name)
+        return True
 
     def _on_data_changed(self, event=None):
-        """フォームのデータが変更されたときに呼び出される"""
-        if not self.selected_character_id: return
-        self._save_current_character_data()
-        self.app._mark_dirty()
-        
-        char = self.characters[self.selected_character_id]
-        self.char_tree.item(char.id, values=(char.name,))
+        """フォームのデータが変更されたときに呼び出される（連続したイベントは1回にまとめる）"""
+        if not self.selected_character_id or not self._edit_dirty: return
+        if self._edit_after_id:
+            self.app.root.after_cancel(self._edit_after_id)
+        self._edit_after_id = self.app.root.after(self._EDIT_FLUSH_DELAY_MS, self._commit_character_edit)
 
     def _add_character(self):
-        self._save_current_character_data()
+        self._commit_character_edit()
         new_char = Character()
         self.characters[new_char.id] = new_char
+        self._sync_serialized(new_char)
         self.app._mark_dirty()
-        self._update_character_list()
+        self._tree_insert_character(new_char)
         
         self.char_tree.selection_set(new_char.id)
         self.char_tree.focus(new_char.id)
@@ -292,19 +399,23 @@ class CharacterManagerPlugin(IPlugin):
             "確認", f"キャラクター '{char.name}' を削除しますか？\nこの操作は元に戻せません。", parent=self.main_frame):
             return
             
-        del self.characters[self.selected_character_id]
         self.select_character(None)
+        del self.characters[char.id]
+        del self._serialized_chars[char.id]
         self.app._mark_dirty()
-        self._update_character_list()
+        self._tree_delete_character(char)
 
     def _choose_color(self):
         if not self.selected_character_id: return
         char = self.characters[self.selected_character_id]
+        # 色選択ダイアログは使われるまで読み込まない（起動時のプラグイン読み込みを軽くする）
+        from tkinter import colorchooser
         
         color_code = colorchooser.askcolor(title="テーマカラーを選択", initialcolor=char.color, parent=self.main_frame)
         if color_code and color_code[1]:
             char.color = color_code[1]
             self.color_swatch.config(bg=char.color)
+            self._sync_serialized(char)
             self.app._mark_dirty()
 
     def _choose_image(self):
@@ -322,4 +433,5 @@ class CharacterManagerPlugin(IPlugin):
             self.image_path_entry.delete(0, tk.END)
             self.image_path_entry.insert(0, char.image_path)
             self.image_path_entry.config(state="readonly")
+            self._sync_serialized(char)
             self.app._mark_dirty()